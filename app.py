@@ -2,18 +2,124 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
 import asyncio
 from data_fetcher import DataFetcher
 from technical_indicators import TechnicalIndicators
 from ema_analyzer import EMAAnalyzer
 from deepseek_client import DeepSeekClient
 from config import DEEPSEEK_API_KEY, TUSHARE_TOKEN
-from logger import logger
+from logger import logger, configure_file_logging
 
-# 初始化客户端
+@st.cache_resource
+def get_data_fetcher(token: str) -> DataFetcher:
+    """获取数据获取器（每个进程只创建一次）"""
+    return DataFetcher(token)
+
+@st.cache_resource
+def get_deepseek_client() -> DeepSeekClient:
+    """获取DeepSeek客户端（每个进程只创建一次）"""
+    return DeepSeekClient()
+
+@st.cache_data(show_spinner=False)
+def compute_indicators(df: pd.DataFrame, ema_short_period: int, ema_long_period: int) -> pd.DataFrame:
+    """计算技术指标（按输入数据和EMA参数缓存）"""
+    return TechnicalIndicators(df).calculate_all(ema_short_period, ema_long_period)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def run_analysis(
+    code: str,
+    start_date: str,
+    end_date: str,
+    asset_type: str,
+    ema_short_period: int,
+    ema_long_period: int,
+    stock_name: str
+) -> Tuple[pd.DataFrame, List[Dict]]:
+    """获取数据、计算指标并检测交叉点（按输入参数缓存）
+    
+    相同参数重复点击分析时直接返回缓存结果，图表在调用方构建。
+    LLM决策不在此缓存：请求失败时返回的是失败提示，缓存后会在一小时内反复展示，
+    成功的回复已由LLMCache按提示词缓存。
+    
+    Returns:
+        (分析区间内的数据, 交叉点列表)
+        
+    Raises:
+        ValueError: 数据获取失败（异常不会被缓存）
+    """
+    # 计算扩展的开始日期（往前推60天），让EMA等指标在分析区间开始前完成预热
+    start_date_dt = datetime.strptime(start_date, "%Y%m%d")
+    extended_start_date = (start_date_dt - timedelta(days=60)).strftime("%Y%m%d")
+    logger.info(f"扩展数据获取范围: {extended_start_date} - {end_date}")
+    
+    # 获取分钟数据（股票名称已在侧边栏查询并缓存，由调用方传入）
+    df = get_data_fetcher(TUSHARE_TOKEN).get_minute_data(
+        code=code,
+        start_date=extended_start_date,
+        end_date=end_date,
+        freq="60min",
+        save_dir="minute_data",
+        asset_type=asset_type
+    )
+    
+    if df is None:
+        raise ValueError(f"数据获取失败: {code}")
+    
+    logger.info(f"数据获取成功, 数据量: {len(df)}")
+    # 计算技术指标
+    df = compute_indicators(df, ema_short_period, ema_long_period)
+    
+    # 只保留实际需要的时间范围的数据
+    # date列在获取时已解析为datetime，直接与时间戳比较，结束日期包含当天
+    start_ts = pd.Timestamp(start_date)
+    end_ts = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+    df = df[(df['date'] >= start_ts) & (df['date'] < end_ts)]
+    
+    logger.info("数据量: {}", len(df))
+    # 数据样例仅在DEBUG级别输出，lazy模式下没有DEBUG处理器时不会格式化
+    logger.opt(lazy=True).debug("df head: {}", lambda: df.head().to_string())
+    
+    # 创建EMA分析器
+    analyzer = EMAAnalyzer(
+        df, ema_short_period, ema_long_period,
+        stock_name=stock_name, stock_code=code, deepseek=get_deepseek_client()
+    )
+    
+    # 检测交叉点
+    crossovers = analyzer.detect_crossovers()
+    logger.info(f"交叉点数量: {len(crossovers)}， 其中金叉: {len([c for c in crossovers if c['type'] == 'golden_cross'])}， 死叉: {len([c for c in crossovers if c['type'] == 'death_cross'])}")
+    return df, crossovers
+
+def get_decisions(
+    df: pd.DataFrame,
+    crossovers: List[Dict],
+    code: str,
+    ema_short_period: int,
+    ema_long_period: int,
+    stock_name: str
+) -> List[str]:
+    """分批并发获取各交叉点的LLM决策（不缓存，失败的请求下次分析时会重试）
+    
+    Returns:
+        LLM决策列表
+    """
+    if not crossovers:
+        return []
+    analyzer = EMAAnalyzer(
+        df, ema_short_period, ema_long_period,
+        stock_name=stock_name, stock_code=code, deepseek=get_deepseek_client()
+    )
+    return asyncio.run(analyzer.get_trading_suggestions_batch(crossovers))
+
+# K线图最多直接绘制的K线数量，超过后按日聚合
+MAX_CANDLES = 3000
+
+# 初始化日志和客户端
+configure_file_logging()
 logger.info("初始化系统组件")
-deepseek_client = DeepSeekClient()
-data_fetcher = DataFetcher(TUSHARE_TOKEN)
+deepseek_client = get_deepseek_client()
+data_fetcher = get_data_fetcher(TUSHARE_TOKEN)
 
 # 页面配置
 st.set_page_config(
@@ -39,9 +145,12 @@ with st.sidebar:
     # 代码输入
     code = st.text_input("输入代码", "000001.SZ")
     
-    # 获取股票名称
+    # 获取股票名称（仅在代码变化时重新查询，其它控件变化引起的重跑直接复用）
     if code:
-        stock_info = data_fetcher.get_stock_info(code)
+        if st.session_state.get('stock_code_cached') != code or st.session_state.get('stock_info_cached') is None:
+            st.session_state['stock_info_cached'] = data_fetcher.get_stock_info(code)
+            st.session_state['stock_code_cached'] = code
+        stock_info = st.session_state['stock_info_cached']
         if stock_info is not None:
             st.info(f"股票名称: {stock_info['name']}")
             stock_name = stock_info['name']
@@ -77,68 +186,42 @@ with st.sidebar:
 if st.button("开始分析"):
     logger.info(f"开始分析: {code}, 时间范围: {start_date} - {end_date}")
     with st.spinner("正在获取数据..."):
-        # 计算扩展的开始日期（往前推50天）
-        start_date_dt = datetime.strptime(start_date, "%Y%m%d")
-        extended_start_date = (start_date_dt - timedelta(days=60)).strftime("%Y%m%d")
-        logger.info(f"扩展数据获取范围: {extended_start_date} - {end_date}")
+        try:
+            df, crossovers = run_analysis(
+                code, start_date, end_date, asset_type, ema_short_period, ema_long_period, stock_name
+            )
+        except ValueError:
+            df = None
         
-        # 获取数据
-        # df = data_fetcher.get_daily_data(code, extended_start_date, end_date, asset_type)
-        df = data_fetcher.get_minute_data(
-            code=code,
-            start_date=start_date,
-            end_date=end_date,
-            freq="60min",
-            save_dir="minute_data"
-        )
+        if df is not None:
+            decisions = get_decisions(df, crossovers, code, ema_short_period, ema_long_period, stock_name)
         
         if df is None:
             logger.error("数据获取失败")
             st.error("获取数据失败，请检查代码和日期是否正确")
         else:
-            logger.info(f"数据获取成功, 数据量: {len(df)}")
-            # 计算技术指标
-            indicators = TechnicalIndicators(df)
-            df = indicators.calculate_all(ema_short_period, ema_long_period)
-            
-            # 只保留实际需要的时间范围的数据
-            # 将df中的date列格式化为yyyymmdd格式再比较
-            df['date_formatted'] = pd.to_datetime(df['date']).dt.strftime('%Y%m%d')
-            df = df[(df['date_formatted'] >= start_date) & (df['date_formatted'] <= end_date)]
-            df = df.drop(columns=['date_formatted'])  # 删除临时列
-
-            logger.info(f"数据量: {len(df)}, df: {df}")
-            
-            # 创建EMA分析器
-            analyzer = EMAAnalyzer(df, ema_short_period, ema_long_period, stock_name=stock_name, stock_code=code)
-            
-            # 检测交叉点
-            crossovers = analyzer.detect_crossovers()
-            
             # 显示结果
             st.subheader("分析结果")
             
-            # 创建结果表格
-            results = []
-            logger.info(f"交叉点数量: {len(crossovers)}， 其中金叉: {len([c for c in crossovers if c['type'] == 'golden_cross'])}， 死叉: {len([c for c in crossovers if c['type'] == 'death_cross'])}")
-            for crossover in crossovers:
-                # 获取LLM决策
-                logger.info(f"获取{crossover['date']}的决策")
-                decision = analyzer.get_trading_suggestion(crossover)
-                
-                results.append({
-                    "日期": crossover["date"],
-                    "类型": "金叉" if crossover["type"] == "golden_cross" else "死叉",
-                    "收盘价": f"{crossover['indicators']['close']:.2f}",
-                    f"EMA{ema_short_period}": f"{crossover['indicators']['EMA_short']:.2f}",
-                    f"EMA{ema_long_period}": f"{crossover['indicators']['EMA_long']:.2f}",
-                    "LLM决策": decision
+            # 显示结果表格，数值列保留原始浮点数，由表格统一格式化
+            if crossovers:
+                ema_short_col = f"EMA{ema_short_period}"
+                ema_long_col = f"EMA{ema_long_period}"
+                results = pd.DataFrame({
+                    "日期": [c["date"] for c in crossovers],
+                    "类型": pd.Series([c["type"] for c in crossovers]).map({"golden_cross": "金叉", "death_cross": "死叉"}),
+                    "收盘价": [c["indicators"]["close"] for c in crossovers],
+                    ema_short_col: [c["indicators"]["EMA_short"] for c in crossovers],
+                    ema_long_col: [c["indicators"]["EMA_long"] for c in crossovers],
+                    "LLM决策": decisions
                 })
-            
-            # 显示结果表格
-            if results:
                 logger.info(f"分析完成，共{len(results)}个结果")
-                st.dataframe(pd.DataFrame(results))
+                number_column = st.column_config.NumberColumn(format="%.2f")
+                st.dataframe(results, column_config={
+                    "收盘价": number_column,
+                    ema_short_col: number_column,
+                    ema_long_col: number_column
+                })
             else:
                 logger.info("未检测到交叉点")
                 st.info("在选定时间范围内没有检测到金叉或死叉")
@@ -147,25 +230,32 @@ if st.button("开始分析"):
             st.subheader("K线图")
             fig = go.Figure()
             
+            # K线过多时按日聚合，减少传给浏览器的数据量
+            candles = df
+            if len(df) > MAX_CANDLES:
+                candles = df.resample('D', on='date').agg(
+                    {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last'}
+                ).dropna().reset_index()
+            
             # 添加K线图
             fig.add_trace(go.Candlestick(
-                x=df['date'],
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
+                x=candles['date'],
+                open=candles['open'],
+                high=candles['high'],
+                low=candles['low'],
+                close=candles['close'],
                 name='K线'
             ))
             
-            # 添加均线
-            fig.add_trace(go.Scatter(
+            # 添加均线（保持原始频率，使用WebGL渲染）
+            fig.add_trace(go.Scattergl(
                 x=df['date'],
                 y=df['EMA_short'],
                 name=f'EMA{ema_short_period}',
                 line=dict(color='blue')
             ))
             
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=df['date'],
                 y=df['EMA_long'],
                 name=f'EMA{ema_long_period}',
@@ -1,11 +1,245 @@
-import tushare as ts
 import pandas as pd
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
 from typing import Optional, Tuple, Dict
 from loguru import logger
+import functools
+import hashlib
 import os
 
+# tushare pro HTTP接口地址
+TUSHARE_API_URL = "http://api.tushare.pro"
+
+
+class TushareClient:
+    """tushare pro接口客户端
+
+    与ts.pro_api()用法一致（如client.daily(ts_code=...)），但所有请求共用一个
+    requests.Session，长连接在多次调用之间复用，省去重复的TCP握手。
+    """
+
+    def __init__(self, token: str, timeout: int = 30):
+        """初始化
+
+        Args:
+            token: tushare token
+            timeout: 请求超时时间（秒）
+        """
+        self.token = token
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def query(self, api_name: str, fields: str = '', **kwargs) -> pd.DataFrame:
+        """调用tushare pro接口
+
+        Args:
+            api_name: 接口名称
+            fields: 返回字段，逗号分隔
+            **kwargs: 接口参数
+
+        Returns:
+            接口返回数据DataFrame
+        """
+        payload = {"api_name": api_name, "token": self.token, "params": kwargs, "fields": fields}
+        response = self.session.post(TUSHARE_API_URL, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        result = response.json()
+        if result["code"] != 0:
+            raise Exception(result["msg"])
+        data = result["data"]
+        return pd.DataFrame(data["items"], columns=data["fields"])
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return functools.partial(self.query, name)
+
+
+def _downcast_values(df: pd.DataFrame) -> pd.DataFrame:
+    """将价格列收窄为float32，减少后续指标计算和图表序列化的数据量
+
+    成交量常超过2^24，float32无法精确表示，保留float64。
+
+    Args:
+        df: 行情数据DataFrame
+
+    Returns:
+        转换后的DataFrame
+    """
+    price_cols = [col for col in ("open", "high", "low", "close") if col in df.columns]
+    df[price_cols] = df[price_cols].astype("float32")
+    if "vol" in df.columns:
+        df["vol"] = df["vol"].astype("float64")
+    return df
+
+
+def _sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """按日期升序排列
+
+    tushare通常按日期倒序返回数据，此时直接反转即可，避免O(NlogN)的排序。
+
+    Args:
+        df: 包含date列的DataFrame
+
+    Returns:
+        按日期升序排列的DataFrame
+    """
+    if df["date"].is_monotonic_increasing:
+        return df
+    if df["date"].is_monotonic_decreasing:
+        # 反转只得到负步长视图，copy()后各列才是连续数组
+        return df.iloc[::-1].reset_index(drop=True).copy()
+    return df.sort_values("date", kind="mergesort", ignore_index=True)
+
+
+def _normalize_frame(df: pd.DataFrame, date_column: str, date_format: Optional[str] = None) -> pd.DataFrame:
+    """统一日线和分钟数据的格式：日期列命名为date并解析为datetime，按日期升序排列，价格列收窄为float32
+
+    Args:
+        df: tushare返回的原始DataFrame
+        date_column: 原始日期列名
+        date_format: 日期格式，None表示自动识别
+
+    Returns:
+        整理后的DataFrame
+    """
+    if date_column in df.columns:
+        df = df.rename(columns={date_column: "date"})
+    df["date"] = pd.to_datetime(df["date"], format=date_format, cache=True)
+    return _downcast_values(_sort_by_date(df))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_daily(
+    _pro,
+    token_hash: str,
+    code: str,
+    start_date: str,
+    end_date: str,
+    asset_type: str
+) -> pd.DataFrame:
+    """从tushare拉取日线数据（结果按参数缓存）
+
+    Args:
+        _pro: tushare接口客户端，不参与缓存键计算
+        token_hash: token摘要，用于区分不同账号的缓存
+        code: 证券代码
+        start_date: 开始日期，格式：YYYYMMDD
+        end_date: 结束日期，格式：YYYYMMDD
+        asset_type: 资产类型，可选：stock/future/fund
+
+    Returns:
+        日线数据DataFrame
+    """
+    if asset_type == "stock":
+        logger.debug("获取股票日线数据")
+        df = _pro.daily(ts_code=code, start_date=start_date, end_date=end_date)
+    elif asset_type == "future":
+        logger.debug("获取期货日线数据")
+        df = _pro.fut_daily(ts_code=code, start_date=start_date, end_date=end_date)
+    elif asset_type == "fund":
+        logger.debug("获取ETF日线数据")
+        df = _pro.fund_daily(ts_code=code, start_date=start_date, end_date=end_date)
+    else:
+        logger.error(f"不支持的资产类型: {asset_type}")
+        raise ValueError(f"Unsupported asset type: {asset_type}")
+
+    return _normalize_frame(df, "trade_date", date_format="%Y%m%d")
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _fetch_stock_info(_pro, token_hash: str, code: str) -> Optional[Dict]:
+    """从tushare拉取股票基本信息（结果按参数缓存）
+
+    Args:
+        _pro: tushare接口客户端，不参与缓存键计算
+        token_hash: token摘要，用于区分不同账号的缓存
+        code: 股票代码
+
+    Returns:
+        股票基本信息字典，未找到返回None
+    """
+    df = _pro.stock_basic(ts_code=code, fields='ts_code,name,area,industry')
+    if len(df) > 0:
+        return df.iloc[0].to_dict()
+    logger.warning(f"未找到股票信息: {code}")
+    return None
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_minute(
+    _pro,
+    token_hash: str,
+    code: str,
+    start_date: str,
+    end_date: str,
+    freq: str,
+    save_dir: str,
+    asset_type: str
+) -> Optional[pd.DataFrame]:
+    """读取本地缓存或从tushare拉取分钟数据（结果按参数缓存）
+
+    Args:
+        _pro: tushare接口客户端，不参与缓存键计算
+        token_hash: token摘要，用于区分不同账号的缓存
+        code: 证券代码
+        start_date: 开始日期，格式：YYYYMMDD
+        end_date: 结束日期，格式：YYYYMMDD
+        freq: 频率，可选：1min/5min/15min/30min/60min
+        save_dir: 保存目录
+        asset_type: 资产类型，可选：stock/future/fund
+
+    Returns:
+        DataFrame数据，无数据返回None
+    """
+    # 检查是否存在已有文件（按文件名直接探测，无需遍历目录）
+    filename = f"{code}_{asset_type}_{freq}_{start_date}_{end_date}.parquet"
+    filepath = os.path.join(save_dir, filename)
+    if os.path.exists(filepath):
+        logger.info(f"找到已存在的数据文件: {filename}")
+        return _sort_by_date(pd.read_parquet(filepath, engine="pyarrow"))
+
+    # 根据资产类型获取分钟数据
+    if asset_type == "stock":
+        logger.debug("获取股票分钟数据")
+        df = _pro.pro_bar(ts_code=code, start_date=start_date, end_date=end_date, freq=freq)
+    elif asset_type == "future":
+        logger.debug("获取期货分钟数据")
+        df = _pro.ft_mins(ts_code=code, start_date=start_date, end_date=end_date, freq=freq)
+    elif asset_type == "fund":
+        logger.debug("获取ETF分钟数据")
+        df = _pro.pro_bar(ts_code=code, start_date=start_date, end_date=end_date, freq=freq, asset="FD")
+    else:
+        logger.error(f"不支持的资产类型: {asset_type}")
+        raise ValueError(f"Unsupported asset type: {asset_type}")
+
+    if df is None or len(df) == 0:
+        logger.warning(f"未获取到数据")
+        return None
+
+    df = _normalize_frame(df, "trade_time")
+
+    # 保存为parquet，读取时无需重新解析文本，且保留date的datetime类型
+    if "ts_code" in df.columns:
+        df["ts_code"] = df["ts_code"].astype("category")
+    os.makedirs(save_dir, exist_ok=True)
+    df.to_parquet(filepath, engine="pyarrow", compression="zstd", index=False)
+    logger.info(f"成功保存{len(df)}条记录到: {filepath}")
+    return df
+
+
 class DataFetcher:
-    """数据获取类"""
+    """数据获取类
+
+    接口调用结果通过st.cache_data缓存，Streamlit重跑脚本时相同参数的请求直接命中缓存。
+    返回的DataFrame中date列已解析为datetime64，下游无需再次解析；数据已按date升序排列，
+    价格列为float32、成交量为float64，df['close'].to_numpy()等取列操作直接返回连续数组，不产生拷贝，
+    指标计算的热点循环应一次性取出numpy数组后按位置访问。
+    """
     
     def __init__(self, token: str):
         """初始化
@@ -14,8 +248,8 @@ class DataFetcher:
             token: tushare token
         """
         logger.info("初始化数据获取器")
-        ts.set_token(token)
-        self.pro = ts.pro_api()
+        self.pro = TushareClient(token)
+        self.token_hash = hashlib.sha256((token or "").encode("utf-8")).hexdigest()
         
     def get_daily_data(
         self,
@@ -37,26 +271,7 @@ class DataFetcher:
         """
         logger.info(f"开始获取{asset_type}数据: {code}, 时间范围: {start_date} - {end_date}")
         try:
-            if asset_type == "stock":
-                logger.debug("获取股票日线数据")
-                df = self.pro.daily(ts_code=code, start_date=start_date, end_date=end_date)
-            elif asset_type == "future":
-                logger.debug("获取期货日线数据")
-                df = self.pro.fut_daily(ts_code=code, start_date=start_date, end_date=end_date)
-            elif asset_type == "fund":
-                logger.debug("获取ETF日线数据")
-                df = self.pro.fund_daily(ts_code=code, start_date=start_date, end_date=end_date)
-            else:
-                logger.error(f"不支持的资产类型: {asset_type}")
-                raise ValueError(f"Unsupported asset type: {asset_type}")
-                
-            # 统一日期列名为date
-            if "trade_date" in df.columns:
-                df = df.rename(columns={"trade_date": "date"})
-
-            # 按日期升序排序
-            df = df.sort_values("date")
-            
+            df = _fetch_daily(self.pro, self.token_hash, code, start_date, end_date, asset_type)
             logger.info(f"成功获取数据，共{len(df)}条记录")
             return df
             
@@ -75,13 +290,7 @@ class DataFetcher:
         """
         logger.info(f"获取股票基本信息: {code}")
         try:
-            # 获取股票基本信息
-            df = self.pro.stock_basic(ts_code=code, fields='ts_code,name,area,industry')
-            if len(df) > 0:
-                return df.iloc[0].to_dict()
-            else:
-                logger.warning(f"未找到股票信息: {code}")
-                return None
+            return _fetch_stock_info(self.pro, self.token_hash, code)
         except Exception as e:
             logger.error(f"获取股票信息失败: {str(e)}")
             return None 
@@ -95,7 +304,7 @@ class DataFetcher:
         save_dir: str = 'minute_data',
         asset_type: str = "stock"
     ) -> Optional[pd.DataFrame]:
-        """获取分钟级数据并保存到csv
+        """获取分钟级数据并保存到parquet
         
         Args:
             code: 证券代码
@@ -110,46 +319,9 @@ class DataFetcher:
         """
         logger.info(f"开始获取{asset_type}分钟数据: {code}, 频率: {freq}, 时间范围: {start_date} - {end_date}")
         try:
-            # 创建保存目录
-            if not os.path.exists(save_dir):
-                os.makedirs(save_dir)
-            
-            # 检查是否存在已有文件
-            filename = f"{code}_{asset_type}_{freq}_{start_date}_{end_date}.csv"
-            filepath = os.path.join(save_dir, filename)
-            if os.path.exists(filepath):
-                logger.info(f"找到已存在的数据文件: {filename}")
-                return pd.read_csv(filepath)
-                
-            # 根据资产类型获取分钟数据
-            if asset_type == "stock":
-                logger.debug("获取股票分钟数据")
-                df = self.pro.pro_bar(ts_code=code, start_date=start_date, end_date=end_date, freq=freq)
-            elif asset_type == "future":
-                logger.debug("获取期货分钟数据")
-                df = self.pro.ft_mins(ts_code=code, start_date=start_date, end_date=end_date, freq=freq)
-            elif asset_type == "fund":
-                logger.debug("获取ETF分钟数据")
-                df = self.pro.pro_bar(ts_code=code, start_date=start_date, end_date=end_date, freq=freq, asset="FD")
-            else:
-                logger.error(f"不支持的资产类型: {asset_type}")
-                return None
-            
-            if df is None or len(df) == 0:
-                logger.warning(f"未获取到数据")
-                return None
-                
-            # 统一日期列名
-            if "trade_time" in df.columns:
-                df = df.rename(columns={"trade_time": "date"})
-                
-            # 按时间升序排序
-            df = df.sort_values("date")
-            
-            # 保存到csv
-            df.to_csv(filepath, index=False)
-            logger.info(f"成功保存{len(df)}条记录到: {filepath}")
-            return df
+            return _fetch_minute(
+                self.pro, self.token_hash, code, start_date, end_date, freq, save_dir, asset_type
+            )
             
         except Exception as e:
             logger.error(f"获取或保存分钟数据失败: {str(e)}")
@@ -1,27 +1,49 @@
+import asyncio
+import functools
 import httpx
 from typing import Dict, Any, List
 from config import DEEPSEEK_API_KEY, DEEPSEEK_API_BASE
 from openai import OpenAI
 from loguru import logger
 
+# 默认模型（DeepSeek应用ID）和温度参数
+DEEPSEEK_MODEL = "bot-20250329163710-8zcqm"
+DEEPSEEK_TEMPERATURE = 0.7
+
 class DeepSeekClient:
-    """DeepSeek API客户端"""
+    """DeepSeek API客户端
+    
+    底层使用带连接池的httpx.Client，长连接在所有请求之间复用，
+    应在进程内共享同一个实例，避免重复的TCP和TLS握手。
+    """
     
-    def __init__(self):
-        """初始化DeepSeek客户端"""
+    def __init__(self, max_connections: int = 50, max_keepalive_connections: int = 20):
+        """初始化DeepSeek客户端
+        
+        Args:
+            max_connections: 连接池最大连接数
+            max_keepalive_connections: 连接池最大保持连接数
+        """
         logger.info("初始化DeepSeek客户端")
         self.api_key = DEEPSEEK_API_KEY
         self.base_url = DEEPSEEK_API_BASE
+        # 请求在线程池中并发执行，同步的httpx.Client是线程安全的，且不绑定事件循环，
+        # 可以跨多次asyncio.run复用
+        self.http_client = httpx.Client(limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        ))
         self.client = OpenAI(
             api_key=self.api_key,
-            base_url=self.base_url
+            base_url=self.base_url,
+            http_client=self.http_client
         )
     
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
-        model: str = "bot-20250329163710-8zcqm",
-        temperature: float = 0.7,
+        model: str = DEEPSEEK_MODEL,
+        temperature: float = DEEPSEEK_TEMPERATURE,
         max_tokens: int = 2000,
         stream: bool = False
     ) -> Any:
@@ -39,13 +61,16 @@ class DeepSeekClient:
         """
         logger.debug(f"调用DeepSeek API: model={model}, temperature={temperature}")
         try:
-            response = self.client.chat.completions.create(
+            # 同步SDK调用放到线程池执行，避免阻塞事件循环，多个请求可并发
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(None, functools.partial(
+                self.client.chat.completions.create,
                 model=model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 stream=stream
-            )
+            ))
             logger.debug("DeepSeek API调用成功")
             return response
         except Exception as e:
@@ -55,4 +80,4 @@ class DeepSeekClient:
     async def close(self):
         """关闭客户端"""
         logger.info("关闭DeepSeek客户端")
-        await self.client.aclose() 
\ No newline at end of file
+        self.client.close() 
\ No newline at end of file
@@ -1,16 +1,41 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple, Optional
-from deepseek_client import DeepSeekClient
+from typing import List, Dict, Any, Tuple, Optional, Callable
+from deepseek_client import DeepSeekClient, DEEPSEEK_MODEL, DEEPSEEK_TEMPERATURE
+from llm_cache import LLMCache
 from technical_indicators import TechnicalIndicators
 from loguru import logger
 from datetime import datetime
 import asyncio
+import functools
+import json
+
+# 提示词中使用的指标
+PROMPT_INDICATORS = (
+    'close', 'change', 'vol', 'EMA_short', 'EMA_long', 'MACD', 'MACD_signal', 'MACD_hist', 'RSI',
+    'bb_upper', 'bb_middle', 'bb_lower', 'k', 'd', 'j', 'obv', 'atr'
+)
+
+# 系统提示词
+SYSTEM_PROMPT = "你是一个专业的量化交易分析师，请根据技术指标给出交易建议。"
 
 class EMAAnalyzer:
     """双均线分析类"""
     
-    def __init__(self, df: pd.DataFrame, ema_short_period: int = 5, ema_long_period: int = 8, stock_name: str = "", stock_code: str = ""):
+    # LLM回复缓存，所有分析器实例共享
+    _llm_cache: Optional[LLMCache] = None
+    # 未显式传入客户端时所有分析器实例共享的DeepSeek客户端
+    _shared_client: Optional[DeepSeekClient] = None
+    
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        ema_short_period: int = 5,
+        ema_long_period: int = 8,
+        stock_name: str = "",
+        stock_code: str = "",
+        deepseek: Optional[DeepSeekClient] = None
+    ):
         """初始化EMA分析器
         
         Args:
@@ -19,13 +44,38 @@ class EMAAnalyzer:
             ema_long_period: 长期EMA周期
             stock_name: 股票名称
             stock_code: 股票代码
+            deepseek: DeepSeek客户端，默认使用所有实例共享的客户端
         """
+        # 保持原始精度：成交量、价格和OBV等会原样写入提示词
         self.df = df.copy()
+        # 按列缓存numpy数组，热点代码按位置取值，不经过pandas的逐行访问
+        self._cols: Dict[str, np.ndarray] = {c: self.df[c].to_numpy() for c in self.df.columns}
         self.ema_short_period = ema_short_period
         self.ema_long_period = ema_long_period
         self.stock_name = stock_name
         self.stock_code = stock_code
-        self.deepseek = DeepSeekClient()
+        if deepseek is None:
+            if EMAAnalyzer._shared_client is None:
+                EMAAnalyzer._shared_client = DeepSeekClient()
+            deepseek = EMAAnalyzer._shared_client
+        self.deepseek = deepseek
+        self._key_level_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._order: Optional[np.ndarray] = None
+        if EMAAnalyzer._llm_cache is None:
+            EMAAnalyzer._llm_cache = LLMCache()
+        
+    def _crossover_signals(self) -> np.ndarray:
+        """逐行标记EMA交叉
+        
+        Returns:
+            int8数组，1为金叉，-1为死叉，0为无交叉
+        """
+        diff = self._cols['EMA_short'] - self._cols['EMA_long']
+        prev, cur = diff[:-1], diff[1:]
+        cross = np.zeros(len(diff), dtype=np.int8)
+        cross[1:][(cur > 0) & (prev <= 0)] = 1  # 金叉
+        cross[1:][(cur < 0) & (prev >= 0)] = -1  # 死叉
+        return cross
         
     def detect_crossovers(self) -> List[Dict]:
         """检测EMA金叉和死叉
@@ -33,64 +83,53 @@ class EMAAnalyzer:
         Returns:
             包含金叉死叉信号的列表
         """
-        df = self.df.copy()
-        
-        # 计算EMA差值
-        df['ema_diff'] = df['EMA_short'] - df['EMA_long']
-        
         # 检测金叉和死叉
-        df['crossover'] = 0
-        df.loc[(df['ema_diff'] > 0) & (df['ema_diff'].shift(1) <= 0), 'crossover'] = 1  # 金叉
-        df.loc[(df['ema_diff'] < 0) & (df['ema_diff'].shift(1) >= 0), 'crossover'] = -1  # 死叉
+        cross = self._crossover_signals()
+        
+        # 循环内按位置从列数组取值，避免逐行构造Series
+        cols = self._cols
+        # 按日期排序只做一次，数据通常已有序，稳定排序接近线性
+        order = self._date_order()
+        sorted_dates = cols['date'][order]
         
         # 获取交叉点
         crossovers = []
-        for idx in df[df['crossover'] != 0].index:
+        for pos in np.flatnonzero(cross):
             # 获取支撑位和压力位
-            support_levels, resistance_levels = self.find_support_resistance(current_idx=idx)
+            support_levels, resistance_levels = self.find_support_resistance(current_idx=pos)
             
-            # 获取过去5个交易日的数据
-            prev_5_days = []
-            # 确保 DataFrame 按日期排序
-            df_sorted = df.sort_values('date')  # 按日期升序排序
-            # 找到当前日期在排序后DataFrame中的位置
-            current_idx = df_sorted[df_sorted['date'] == df.loc[idx, 'date']].index[0]
-            # 获取当前日期之前的5个交易日数据
-            start_idx = max(0, df_sorted.index.get_loc(current_idx) - 5)
-            end_idx = df_sorted.index.get_loc(current_idx)
-            prev_rows = df_sorted.iloc[start_idx:end_idx]
-            
-            for _, row in prev_rows.iterrows():
-                prev_5_days.append({
-                    'date': row['date'],
-                    'close': row['close'],
-                    'change': row['pct_chg'],
-                    'vol': row['vol'],
-                    'EMA_short': row['EMA_short'],
-                    'EMA_long': row['EMA_long']
-                })
+            # 获取过去5个交易日的数据：二分查找当前日期在排序后的位置，取其前5行
+            sorted_pos = np.searchsorted(sorted_dates, cols['date'][pos], side='left')
+            prev_5_days = [{
+                'date': pd.Timestamp(cols['date'][k]),
+                'close': cols['close'][k],
+                'change': cols['pct_chg'][k],
+                'vol': cols['vol'][k],
+                'EMA_short': cols['EMA_short'][k],
+                'EMA_long': cols['EMA_long'][k]
+            } for k in order[max(0, sorted_pos - 5):sorted_pos]]
             
             crossovers.append({
-                'date': df.loc[idx, 'date'],
-                'type': 'golden_cross' if df.loc[idx, 'crossover'] == 1 else 'death_cross',
+                'date': pd.Timestamp(cols['date'][pos]),
+                'type': 'golden_cross' if cross[pos] == 1 else 'death_cross',
                 'indicators': {
-                    'close': df.loc[idx, 'close'],
-                    'change': df.loc[idx, 'pct_chg'],
-                    'vol': df.loc[idx, 'vol'],
-                    'EMA_short': df.loc[idx, 'EMA_short'],
-                    'EMA_long': df.loc[idx, 'EMA_long'],
-                    'RSI': df.loc[idx, 'RSI'],
-                    'MACD': df.loc[idx, 'MACD'],
-                    'MACD_signal': df.loc[idx, 'MACD_signal'],
-                    'MACD_hist': df.loc[idx, 'MACD_hist'],
-                    'k': df.loc[idx, 'k'],
-                    'd': df.loc[idx, 'd'],
-                    'j': df.loc[idx, 'j'],
-                    'obv': df.loc[idx, 'obv'],
-                    'atr': df.loc[idx, 'atr'],
-                    'bb_upper': df.loc[idx, 'bb_upper'],
-                    'bb_middle': df.loc[idx, 'bb_middle'],
-                    'bb_lower': df.loc[idx, 'bb_lower'],
+                    'close': cols['close'][pos],
+                    'change': cols['pct_chg'][pos],
+                    'vol': cols['vol'][pos],
+                    'EMA_short': cols['EMA_short'][pos],
+                    'EMA_long': cols['EMA_long'][pos],
+                    'RSI': cols['RSI'][pos],
+                    'MACD': cols['MACD'][pos],
+                    'MACD_signal': cols['MACD_signal'][pos],
+                    'MACD_hist': cols['MACD_hist'][pos],
+                    'k': cols['k'][pos],
+                    'd': cols['d'][pos],
+                    'j': cols['j'][pos],
+                    'obv': cols['obv'][pos],
+                    'atr': cols['atr'][pos],
+                    'bb_upper': cols['bb_upper'][pos],
+                    'bb_middle': cols['bb_middle'][pos],
+                    'bb_lower': cols['bb_lower'][pos],
                     'support_levels': support_levels,
                     'resistance_levels': resistance_levels
                 },
@@ -106,26 +145,28 @@ class EMAAnalyzer:
             window: 趋势判断窗口
             
         Returns:
-            包含趋势分析的DataFrame
+            包含ema_short_slope、ema_long_slope、trend三列的DataFrame，索引与原数据一致
         """
-        df = self.df.copy()
-        
         # 计算EMA斜率
-        df['ema_short_slope'] = df['EMA_short'].diff(window) / window
-        df['ema_long_slope'] = df['EMA_long'].diff(window) / window
+        ema_short_slope = self.df['EMA_short'].diff(window).to_numpy() / window
+        ema_long_slope = self.df['EMA_long'].diff(window).to_numpy() / window
         
         # 判断趋势
-        df['trend'] = 0
-        df.loc[(df['ema_short_slope'] > 0) & (df['ema_long_slope'] > 0), 'trend'] = 1  # 上升趋势
-        df.loc[(df['ema_short_slope'] < 0) & (df['ema_long_slope'] < 0), 'trend'] = -1  # 下降趋势
-        
-        return df
+        trend = np.zeros(len(self.df), dtype=np.int64)
+        trend[(ema_short_slope > 0) & (ema_long_slope > 0)] = 1  # 上升趋势
+        trend[(ema_short_slope < 0) & (ema_long_slope < 0)] = -1  # 下降趋势
+        
+        return pd.DataFrame({
+            'ema_short_slope': ema_short_slope,
+            'ema_long_slope': ema_long_slope,
+            'trend': trend
+        }, index=self.df.index)
     
     def find_support_resistance(self, current_idx: Optional[int] = None, window: int = 20) -> Tuple[List[float], List[float]]:
         """寻找支撑位和阻力位
         
         Args:
-            current_idx: 当前交叉点的索引
+            current_idx: 当前交叉点在DataFrame中的位置
             window: 寻找局部极值的窗口大小
             
         Returns:
@@ -133,45 +174,12 @@ class EMAAnalyzer:
         """
         logger.debug(f"开始查找支撑位和压力位, current_idx: {current_idx}")
         
-        # 从DataFrame中获取支撑位和压力位
-        if current_idx is not None and current_idx < len(self.df):
-            row = self.df.iloc[current_idx]
-            logger.debug(f"当前行数据: {row.to_dict()}")
-            logger.debug(f"support_levels类型: {type(row['support_levels'])}, 值: {row['support_levels']}")
-            logger.debug(f"resistance_levels类型: {type(row['resistance_levels'])}, 值: {row['resistance_levels']}")
-            
-            # 获取过去5天的支撑位和压力位
-            past_5_days_support = []
-            past_5_days_resistance = []
-            
-            # 确保DataFrame按日期排序
-            df_sorted = self.df.sort_values('date')
-            current_date = row['date']
-            current_sorted_idx = df_sorted[df_sorted['date'] == current_date].index[0]
-            start_idx = max(0, df_sorted.index.get_loc(current_sorted_idx) - 4)  # 获取前4天（加上当天共5天）
-            past_5_days = df_sorted.iloc[start_idx:df_sorted.index.get_loc(current_sorted_idx) + 1]
-            
-            logger.debug(f"过去5天日期: {past_5_days['date'].tolist()}")
-            
-            # 收集过去5天的支撑位和压力位
-            for _, past_row in past_5_days.iterrows():
-                if isinstance(past_row['support_levels'], list) and len(past_row['support_levels']) >= 2:
-                    past_5_days_support.append(past_row['support_levels'])
-                if isinstance(past_row['resistance_levels'], list) and len(past_row['resistance_levels']) >= 2:
-                    past_5_days_resistance.append(past_row['resistance_levels'])
-            
-            logger.debug(f"过去5天支撑位: {past_5_days_support}")
-            logger.debug(f"过去5天压力位: {past_5_days_resistance}")
-            
-            # 计算平均值
-            avg_strong_support = np.mean([levels[0] for levels in past_5_days_support]) if past_5_days_support else None
-            avg_support = np.mean([levels[1] for levels in past_5_days_support]) if past_5_days_support else None
-            avg_strong_resistance = np.mean([levels[0] for levels in past_5_days_resistance]) if past_5_days_resistance else None
-            avg_resistance = np.mean([levels[1] for levels in past_5_days_resistance]) if past_5_days_resistance else None
+        if current_idx is not None and 0 <= current_idx < len(self.df):
+            support_avg, resistance_avg = self._average_key_levels()
             
             # 构建返回结果
-            support_levels = [avg_strong_support, avg_support] if avg_strong_support is not None and avg_support is not None else []
-            resistance_levels = [avg_strong_resistance, avg_resistance] if avg_strong_resistance is not None and avg_resistance is not None else []
+            support_levels = support_avg[current_idx].tolist() if not np.isnan(support_avg[current_idx]).any() else []
+            resistance_levels = resistance_avg[current_idx].tolist() if not np.isnan(resistance_avg[current_idx]).any() else []
             
             logger.debug(f"5天平均支撑位: {support_levels}")
             logger.debug(f"5天平均压力位: {resistance_levels}")
@@ -180,6 +188,36 @@ class EMAAnalyzer:
         
         logger.debug("current_idx无效，返回空列表")
         return [], []
+    
+    def _date_order(self) -> np.ndarray:
+        """按日期升序排列的行位置（稳定排序），结果缓存在实例上
+        
+        Returns:
+            行位置数组
+        """
+        if self._order is None:
+            self._order = np.argsort(self._cols['date'], kind='stable')
+        return self._order
+    
+    def _average_key_levels(self) -> Tuple[np.ndarray, np.ndarray]:
+        """一次性计算每个位置过去5个交易日（含当天）支撑位和压力位的平均值，结果缓存在实例上
+        
+        Returns:
+            (支撑位均值, 压力位均值)，均为按DataFrame行顺序排列的(N, 2)数组，
+            5天内都没有数据的位置为NaN
+        """
+        if self._key_level_cache is None:
+            # 按日期顺序计算滚动均值，再映射回原始行顺序
+            order = self._date_order()
+            averages = []
+            for columns in (('support_1', 'support_2'), ('resistance_1', 'resistance_2')):
+                levels = np.column_stack([self._cols[column] for column in columns])[order]
+                rolling = pd.DataFrame(levels).rolling(5, min_periods=1).mean().to_numpy()
+                result = np.empty_like(rolling)
+                result[order] = rolling
+                averages.append(result)
+            self._key_level_cache = (averages[0], averages[1])
+        return self._key_level_cache
         
     def find_ema_crossovers(self) -> List[int]:
         """寻找EMA交叉点
@@ -187,18 +225,13 @@ class EMAAnalyzer:
         Returns:
             交叉点的索引列表
         """
-        crossovers = []
+        # 计算EMA的差值的符号（NaN的符号为NaN，不会被判定为交叉）
+        sign = np.sign(self._cols['EMA_short'] - self._cols['EMA_long'])
         
-        # 计算EMA的差值
-        ema_diff = self.df['EMA_short'] - self.df['EMA_long']
-        
-        # 寻找交叉点
-        for i in range(1, len(ema_diff)):
-            if (ema_diff.iloc[i-1] < 0 and ema_diff.iloc[i] > 0) or \
-               (ema_diff.iloc[i-1] > 0 and ema_diff.iloc[i] < 0):
-                crossovers.append(i)
+        # 相邻两点符号严格相反即为交叉点
+        crossovers = np.flatnonzero(sign[:-1] * sign[1:] < 0) + 1
                 
-        return crossovers
+        return crossovers.tolist()
         
     def generate_signals(self) -> pd.DataFrame:
         """生成交易信号
@@ -226,25 +259,24 @@ class EMAAnalyzer:
         Returns:
             包含交易信号的字典
         """
-        df = self.df.copy()
-        
         signals = {
             'buy': [],
             'sell': []
         }
         
-        # 获取金叉和死叉信号
-        crossovers = df[df['crossover'] != 0]
+        # 获取金叉和死叉信号，直接遍历交叉点位置，从列数组取值
+        cross = self._crossover_signals()
+        labels = self.df.index
         
-        for idx in crossovers.index:
+        for pos in np.flatnonzero(cross):
             signal = {
-                'date': idx,
-                'price': df.loc[idx, 'Close'],
-                'ema_short': df.loc[idx, 'EMA_short'],
-                'ema_long': df.loc[idx, 'EMA_long']
+                'date': labels[pos],
+                'price': self._cols['close'][pos],
+                'ema_short': self._cols['EMA_short'][pos],
+                'ema_long': self._cols['EMA_long'][pos]
             }
             
-            if df.loc[idx, 'crossover'] == 1:  # 金叉
+            if cross[pos] == 1:  # 金叉
                 signals['buy'].append(signal)
             else:  # 死叉
                 signals['sell'].append(signal)
@@ -257,6 +289,18 @@ class EMAAnalyzer:
         Args:
             crossover: 交叉点信息
             
+        Returns:
+            交易建议
+        """
+        return asyncio.run(self.get_trading_suggestions_batch([crossover]))[0]
+    
+    async def aget_trading_suggestion(self, crossover: Dict, semaphore: Optional[asyncio.Semaphore] = None) -> str:
+        """异步获取交易建议，可配合asyncio.gather并发请求多个交叉点
+        
+        Args:
+            crossover: 交叉点信息
+            semaphore: 限制同时进行的接口请求数，None表示不限制
+            
         Returns:
             交易建议
         """
@@ -267,15 +311,117 @@ class EMAAnalyzer:
         
         # 调用LLM获取建议
         try:
-            response = asyncio.run(self.deepseek.chat_completion([
-                {"role": "system", "content": "你是一个专业的量化交易分析师，请根据技术指标给出交易建议。"},
-                {"role": "user", "content": prompt}
-            ]))
-            return response.choices[0].message.content
+            return await self._acomplete(prompt, semaphore=semaphore)
         except Exception as e:
             logger.error(f"获取LLM建议失败: {str(e)}")
             return "获取建议失败，请稍后重试"
             
+    async def get_trading_suggestions_batch(
+        self,
+        crossovers: List[Dict],
+        batch_size: int = 8,
+        concurrency: int = 4
+    ) -> List[str]:
+        """批量获取交易建议
+        
+        每batch_size个交叉点合并为一次LLM请求，各批次并发执行，分摊系统提示词和HTTP开销；
+        同时进行的接口请求（包括批量解析失败后的逐个请求）不超过concurrency，避免触发接口限流。
+        
+        Args:
+            crossovers: 交叉点信息列表
+            batch_size: 每次请求包含的最大交叉点数量
+            concurrency: 最大并发请求数
+            
+        Returns:
+            交易建议列表，顺序与crossovers一致
+        """
+        # 在每次接口请求处获取信号量，而不是按批次，逐个请求的回退路径也受同一上限约束
+        semaphore = asyncio.Semaphore(concurrency)
+        batches = [crossovers[i:i + batch_size] for i in range(0, len(crossovers), batch_size)]
+        results = await asyncio.gather(*[self._aget_batch_suggestion(batch, semaphore) for batch in batches])
+        return [suggestion for batch_result in results for suggestion in batch_result]
+    
+    async def _aget_batch_suggestion(self, crossovers: List[Dict], semaphore: Optional[asyncio.Semaphore] = None) -> List[str]:
+        """用一次LLM请求获取多个交叉点的交易建议，解析失败时退回逐个请求
+        
+        Args:
+            crossovers: 交叉点信息列表
+            semaphore: 限制同时进行的接口请求数，None表示不限制
+            
+        Returns:
+            交易建议列表，顺序与crossovers一致
+        """
+        if len(crossovers) == 1:
+            return [await self.aget_trading_suggestion(crossovers[0], semaphore)]
+        
+        sections = "\n".join(
+            f"【交叉点{i}】\n{self._build_prompt(crossover)}" for i, crossover in enumerate(crossovers, 1)
+        )
+        prompt = f"""以下是{len(crossovers)}个EMA双均线交叉点的技术指标，请逐个分析是否应该开仓。
+        {sections}
+        请以JSON数组返回结果，数组长度为{len(crossovers)}，按交叉点顺序排列，
+        每个元素是对应交叉点的中文分析字符串，并包含明确的"建议开仓"、"建议不开仓"的结论。
+        只输出JSON数组，不要输出其他内容。
+        """
+        logger.info(f"批量获取交易建议: {len(crossovers)}个交叉点, {crossovers[0]['date']} - {crossovers[-1]['date']}")
+        
+        def parse_suggestions(content: str) -> List[str]:
+            # 去掉可能包裹在外层的markdown代码块
+            suggestions = json.loads(content[content.find('['):content.rfind(']') + 1])
+            if not isinstance(suggestions, list) or len(suggestions) != len(crossovers):
+                raise ValueError(f"批量建议数量不匹配: 期望{len(crossovers)}")
+            return [str(suggestion) for suggestion in suggestions]
+        
+        try:
+            return await self._acomplete(
+                prompt, max_tokens=min(8000, 2000 * len(crossovers)), semaphore=semaphore, parse=parse_suggestions
+            )
+        except Exception as e:
+            logger.warning(f"批量获取LLM建议失败，改为逐个请求: {str(e)}")
+        
+        return list(await asyncio.gather(*[self.aget_trading_suggestion(c, semaphore) for c in crossovers]))
+            
+    async def _acomplete(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        parse: Optional[Callable[[str], Any]] = None
+    ) -> Any:
+        """调用LLM，结果按提示词和模型参数缓存在内存和磁盘中，命中时不再请求接口
+        
+        Args:
+            prompt: 用户提示词
+            max_tokens: 最大token数
+            semaphore: 限制同时进行的接口请求数，None表示不限制；命中缓存时不占用
+            parse: 回复解析函数，解析失败时抛出异常，此时回复不写入缓存
+            
+        Returns:
+            LLM回复内容，指定parse时为解析结果
+        """
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+        params = dict(model=DEEPSEEK_MODEL, temperature=DEEPSEEK_TEMPERATURE, max_tokens=max_tokens)
+        # 切换模型、参数或接口地址后不会命中旧的回复
+        key = LLMCache.make_key(messages, base_url=self.deepseek.base_url, **params)
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            logger.debug(f"命中LLM缓存: {key}")
+            return parse(cached) if parse is not None else cached
+        
+        if semaphore is None:
+            response = await self.deepseek.chat_completion(messages, **params)
+        else:
+            async with semaphore:
+                response = await self.deepseek.chat_completion(messages, **params)
+        content = response.choices[0].message.content
+        # 先解析再写缓存，格式不对的回复不会在之后的运行中被反复取出
+        result = parse(content) if parse is not None else content
+        self._llm_cache.set(key, content)
+        return result
+            
     def _build_prompt(self, crossover: Dict) -> str:
         """构建提示词
         
@@ -288,10 +434,48 @@ class EMAAnalyzer:
         logger.debug("构建LLM提示词")
         indicators = crossover['indicators']
         cross_type = "金叉" if crossover['type'] == 'golden_cross' else "死叉"
+        stock = f'股票: {self.stock_name}({self.stock_code})' if self.stock_name and self.stock_code else ''
+        
+        # 格式化所需的数值按原值组成可哈希的键，相同场景重复回测时直接复用已格式化的提示词
+        return self._format_prompt(
+            stock,
+            crossover['date'],
+            cross_type,
+            tuple(indicators[name] for name in PROMPT_INDICATORS),
+            tuple(indicators.get('support_levels', [])),
+            tuple(indicators.get('resistance_levels', [])),
+            tuple(
+                (day['date'], day['close'], day['vol'], day['EMA_short'], day['EMA_long'], day['change'])
+                for day in crossover.get('prev_5_days') or []
+            )
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_prompt(
+        stock: str,
+        date: Any,
+        cross_type: str,
+        indicator_values: Tuple[float, ...],
+        support_levels: Tuple[float, ...],
+        resistance_levels: Tuple[float, ...],
+        prev_5_days: Tuple[Tuple, ...]
+    ) -> str:
+        """格式化提示词（按参数缓存）
         
-        # 从indicators中获取支撑位和压力位
-        support_levels = indicators.get('support_levels', [])
-        resistance_levels = indicators.get('resistance_levels', [])
+        Args:
+            stock: 股票名称和代码
+            date: 交叉点日期
+            cross_type: 交叉类型
+            indicator_values: 按PROMPT_INDICATORS顺序排列的指标值
+            support_levels: 支撑位
+            resistance_levels: 压力位
+            prev_5_days: 过去5个交易日的(日期, 收盘价, 成交量, EMA短期, EMA长期, 涨跌幅)
+            
+        Returns:
+            提示词
+        """
+        indicators = dict(zip(PROMPT_INDICATORS, indicator_values))
         
         # 格式化支撑位和压力位
         support_str = f"强支撑位: {support_levels[0]:.2f}, 支撑位: {support_levels[1]:.2f}" if len(support_levels) >= 2 else "无数据"
@@ -299,14 +483,14 @@ class EMAAnalyzer:
         
         # 格式化过去5个交易日的数据
         prev_5_days_str = ""
-        if 'prev_5_days' in crossover and crossover['prev_5_days']:
+        if prev_5_days:
             prev_5_days_str = "\n过去5个交易日的基本情况：\n"
-            for i, day in enumerate(crossover['prev_5_days'], 1):
-                prev_5_days_str += f"第{i}天 ({day['date']}): 收盘价 {day['close']:.2f}, 成交量 {day['vol']:.2f}, EMA短期 {day['EMA_short']:.2f}, EMA长期 {day['EMA_long']:.2f}, 涨跌幅 {day['change']:.2f}%\n"
+            for i, (day_date, close, vol, ema_short, ema_long, change) in enumerate(prev_5_days, 1):
+                prev_5_days_str += f"第{i}天 ({day_date}): 收盘价 {close:.2f}, 成交量 {vol:.2f}, EMA短期 {ema_short:.2f}, EMA长期 {ema_long:.2f}, 涨跌幅 {change:.2f}%\n"
         
         return f"""
-        {f'股票: {self.stock_name}({self.stock_code})' if self.stock_name and self.stock_code else ''}
-        在{crossover['date']}出现了EMA双均线{cross_type}，当前技术指标如下：
+        {stock}
+        在{date}出现了EMA双均线{cross_type}，当前技术指标如下：
         
         收盘价: {indicators['close']:.2f}
         涨跌幅: {indicators['change']:.2f}%
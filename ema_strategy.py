@@ -1,7 +1,177 @@
 import pandas as pd
 import numpy as np
 import talib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from jit import njit, NUMBA_AVAILABLE, READONLY_F64, READONLY_BOOL
+
+# 回测结果中收窄为float32存储的指标列
+FLOAT32_INDICATORS = ['short_ema', 'mid_ema', 'long_ema', 'sma200', 'atr', 'obv_ma']
+
+# 平仓类型编码
+EXIT_TAKE_PROFIT = 0
+EXIT_STOP_LOSS = 1
+EXIT_TYPE_NAMES = np.array(['止盈', '止损'])
+
+@njit(f'Tuple((int8[::1], int64[::1], int64[::1], int8[::1], float64[::1], float64[::1], float64[::1], int8[::1], '
+      f'int64, float64, float64, int64))'
+      f'({READONLY_F64}, {READONLY_F64}, {READONLY_F64}, {READONLY_BOOL}, {READONLY_BOOL}, {READONLY_F64}, '
+      f'float64, float64, int64, float64, float64)', cache=True)
+def _run_strategy_loop(high, low, close, long_sig, short_sig, atr,
+                       tp_mult, sl_mult, position, entry_price, atr_value):
+    """逐根K线执行ATR止盈止损和开仓逻辑
+    
+    先检查持仓是否触发止盈止损，平仓后同一根K线可以按信号重新开仓。
+    tp_mult/sl_mult为止盈/止损的ATR倍数，position/entry_price/atr_value为进入循环前的持仓状态。
+    按显式签名提前编译，所有参数都需要传入。
+    
+    Returns:
+        (每根K线的持仓, 交易的开仓位置, 平仓位置, 方向, 开仓价, 平仓价, 盈亏, 平仓类型编码,
+         循环结束时的持仓, 开仓价, ATR, 开仓位置)。开仓位置为-1表示该持仓在循环开始前已建立
+    """
+    n = len(close)
+    positions = np.empty(n, dtype=np.int8)
+    entry_idx = np.empty(n, dtype=np.int64)
+    exit_idx = np.empty(n, dtype=np.int64)
+    sides = np.empty(n, dtype=np.int8)
+    entry_prices = np.empty(n, dtype=np.float64)
+    exit_prices = np.empty(n, dtype=np.float64)
+    pnl = np.empty(n, dtype=np.float64)
+    exit_type = np.empty(n, dtype=np.int8)
+    n_trades = 0
+    entry_i = -1
+    
+    for i in range(n):
+        # ATR止盈止损设置
+        if position != 0:
+            if position > 0:
+                profit_level = entry_price + atr_value * tp_mult
+                stop_loss = entry_price - atr_value * sl_mult
+                hit_profit = high[i] >= profit_level
+                hit_stop = low[i] <= stop_loss
+            else:
+                profit_level = entry_price - atr_value * tp_mult
+                stop_loss = entry_price + atr_value * sl_mult
+                hit_profit = low[i] <= profit_level
+                hit_stop = high[i] >= stop_loss
+            
+            if hit_profit or hit_stop:
+                entry_idx[n_trades] = entry_i
+                exit_idx[n_trades] = i
+                sides[n_trades] = position
+                entry_prices[n_trades] = entry_price
+                exit_prices[n_trades] = close[i]
+                pnl[n_trades] = (close[i] - entry_price) * position
+                exit_type[n_trades] = EXIT_TAKE_PROFIT if hit_profit else EXIT_STOP_LOSS
+                n_trades += 1
+                position = 0
+        
+        # 开仓信号
+        if position == 0:
+            if long_sig[i]:
+                position = 1
+            elif short_sig[i]:
+                position = -1
+            if position != 0:
+                entry_price = close[i]
+                entry_i = i
+                atr_value = atr[i]
+        
+        positions[i] = position
+    
+    return (positions, entry_idx[:n_trades], exit_idx[:n_trades], sides[:n_trades],
+            entry_prices[:n_trades], exit_prices[:n_trades], pnl[:n_trades], exit_type[:n_trades],
+            position, entry_price, atr_value, entry_i)
+
+def _first_exit(high, low, start, position, entry_price, atr_value, tp_mult, sl_mult):
+    """从start开始查找第一根触发止盈或止损的K线
+    
+    按指数增长的窗口向后搜索，持仓时间短时不必扫描整个剩余序列。
+    
+    Returns:
+        (平仓位置, 是否止盈)，未触发返回(-1, False)
+    """
+    if position > 0:
+        profit_level = entry_price + atr_value * tp_mult
+        stop_loss = entry_price - atr_value * sl_mult
+    else:
+        profit_level = entry_price - atr_value * tp_mult
+        stop_loss = entry_price + atr_value * sl_mult
+    
+    n = len(high)
+    window = 256
+    while start < n:
+        stop = min(start + window, n)
+        if position > 0:
+            hit_profit = high[start:stop] >= profit_level
+            hit = hit_profit | (low[start:stop] <= stop_loss)
+        else:
+            hit_profit = low[start:stop] <= profit_level
+            hit = hit_profit | (high[start:stop] >= stop_loss)
+        if hit.any():
+            k = int(hit.argmax())
+            return start + k, bool(hit_profit[k])
+        start = stop
+        window *= 2
+    return -1, False
+
+def _run_strategy_events(high, low, close, long_sig, short_sig, atr,
+                         tp_mult, sl_mult, position, entry_price, atr_value):
+    """_run_strategy_loop的向量化实现，未安装numba时使用，参数和返回值与其一致
+    
+    不逐根K线判断，而是在开仓和平仓事件之间跳转：空仓时用searchsorted定位下一个信号，
+    持仓时用向量比较定位第一根触发止盈止损的K线，循环次数等于交易次数。
+    """
+    n = len(close)
+    # 多头信号优先
+    signal = np.where(long_sig, 1, np.where(short_sig, -1, 0)).astype(np.int8)
+    signal_idx = np.flatnonzero(signal)
+    positions = np.zeros(n, dtype=np.int8)
+    trades = []
+    entry_i = -1
+    i = 0
+    
+    while True:
+        if position == 0:
+            # 平仓的K线上也可以按信号重新开仓
+            k = np.searchsorted(signal_idx, i)
+            if k == len(signal_idx):
+                break
+            i = signal_idx[k]
+            position = int(signal[i])
+            entry_price = close[i]
+            atr_value = atr[i]
+            entry_i = i
+            search_from = i + 1
+        else:
+            # 循环开始前已有的持仓从第一根K线开始检查
+            search_from = i
+        
+        hold_from = max(entry_i, 0)
+        j, is_profit = _first_exit(high, low, search_from, position, entry_price, atr_value, tp_mult, sl_mult)
+        if j < 0:
+            positions[hold_from:] = position
+            break
+        
+        positions[hold_from:j] = position
+        trades.append((entry_i, j, position, entry_price, close[j], (close[j] - entry_price) * position,
+                       EXIT_TAKE_PROFIT if is_profit else EXIT_STOP_LOSS))
+        position = 0
+        i = j
+    
+    entry_idx, exit_idx, sides, entry_prices, exit_prices, pnl, exit_type = (
+        np.array(col, dtype=dtype) for col, dtype in zip(
+            zip(*trades) if trades else [()] * 7,
+            (np.int64, np.int64, np.int8, np.float64, np.float64, np.float64, np.int8)
+        )
+    )
+    return (positions, entry_idx, exit_idx, sides, entry_prices, exit_prices, pnl, exit_type,
+            position, entry_price, atr_value, entry_i)
+
+# numba可用时逐根K线的编译循环最快，否则使用按交易事件跳转的向量化实现
+strategy_loop = _run_strategy_loop if NUMBA_AVAILABLE else _run_strategy_events
+
 
 class DualEMAStrategy:
     def __init__(self):
@@ -18,57 +188,81 @@ class DualEMAStrategy:
         self.atr_value = 0
         
     def calculate_indicators(self, df):
-        # 计算EMA指标
-        df['short_ema'] = talib.EMA(df['close'], timeperiod=self.short_ema_length)
-        df['mid_ema'] = talib.EMA(df['close'], timeperiod=self.mid_ema_length)
-        df['long_ema'] = talib.EMA(df['close'], timeperiod=self.long_ema_length)
-        df['sma200'] = talib.SMA(df['close'], timeperiod=self.sma200_length)
-        
-        # 计算ATR
-        df['atr'] = talib.ATR(df['high'], df['low'], df['close'], timeperiod=self.atr_length)
+        # 一次性取出float64数组，talib直接在numpy数组上计算
+        close = df['close'].to_numpy(np.float64)
+        high = df['high'].to_numpy(np.float64)
+        low = df['low'].to_numpy(np.float64)
+        vol = df['vol'].to_numpy(np.float64)
         
-        # 计算OBV
-        df['obv'] = talib.OBV(df['close'], df['vol'])
-        df['obv_ma'] = talib.SMA(df['obv'], timeperiod=20)
+        obv = talib.OBV(close, vol)
+        indicators = pd.DataFrame({
+            # 计算EMA指标
+            'short_ema': talib.EMA(close, timeperiod=self.short_ema_length),
+            'mid_ema': talib.EMA(close, timeperiod=self.mid_ema_length),
+            'long_ema': talib.EMA(close, timeperiod=self.long_ema_length),
+            'sma200': talib.SMA(close, timeperiod=self.sma200_length),
+            # 计算ATR
+            'atr': talib.ATR(high, low, close, timeperiod=self.atr_length),
+            # 计算OBV
+            'obv': obv,
+            'obv_ma': talib.SMA(obv, timeperiod=20)
+        }, index=df.index)
         
-        return df
+        # 所有指标列一次性拼接，重复计算时先去掉旧的指标列
+        return df.drop(columns=indicators.columns, errors='ignore').join(indicators)
     
     def generate_signals(self, df_15min, df_60min):
-        # 对齐时间索引
-        df_60min = df_60min.reindex(df_15min.index, method='ffill')
-        
-        # 60分钟趋势判断
-        df_15min['h1_bull_market'] = df_60min['close'] > df_60min['sma200']
-        df_15min['h1_bear_market'] = df_60min['close'] < df_60min['sma200']
-        
-        # 15分钟EMA三线共振
-        df_15min['ema_up_trend'] = (
-            (df_15min['short_ema'] > df_15min['mid_ema']) & 
-            (df_15min['mid_ema'] > df_15min['long_ema']) &
-            (df_15min['short_ema'].diff() > 0) &
-            (df_15min['mid_ema'].diff() > 0) &
-            (df_15min['long_ema'].diff() > 0)
+        # 对齐时间索引：每根15分钟K线取不晚于它的最近一根60分钟K线，只取用到的两列
+        idx = np.searchsorted(df_60min.index.to_numpy(), df_15min.index.to_numpy(), side='right') - 1
+        has_h1 = idx >= 0
+        idx = np.clip(idx, 0, None)
+        h1_close = df_60min['close'].to_numpy(np.float64)[idx]
+        h1_sma200 = df_60min['sma200'].to_numpy(np.float64)[idx]
+        
+        # 60分钟趋势判断，第一根60分钟K线之前没有数据，不满足任何方向
+        df_15min['h1_bull_market'] = has_h1 & (h1_close > h1_sma200)
+        df_15min['h1_bear_market'] = has_h1 & (h1_close < h1_sma200)
+        
+        # 15分钟EMA三线共振，在numpy数组上计算，避免产生大量临时Series
+        short_ema = df_15min['short_ema'].to_numpy(np.float64)
+        mid_ema = df_15min['mid_ema'].to_numpy(np.float64)
+        long_ema = df_15min['long_ema'].to_numpy(np.float64)
+        # 首根K线的差分为0，与Series.diff()的NaN一样不满足任何方向
+        short_diff = np.diff(short_ema, prepend=short_ema[:1])
+        mid_diff = np.diff(mid_ema, prepend=mid_ema[:1])
+        long_diff = np.diff(long_ema, prepend=long_ema[:1])
+        
+        ema_up_trend = (
+            (short_ema > mid_ema) & 
+            (mid_ema > long_ema) &
+            (short_diff > 0) &
+            (mid_diff > 0) &
+            (long_diff > 0)
         )
         
-        df_15min['ema_down_trend'] = (
-            (df_15min['short_ema'] < df_15min['mid_ema']) & 
-            (df_15min['mid_ema'] < df_15min['long_ema']) &
-            (df_15min['short_ema'].diff() < 0) &
-            (df_15min['mid_ema'].diff() < 0) &
-            (df_15min['long_ema'].diff() < 0)
+        ema_down_trend = (
+            (short_ema < mid_ema) & 
+            (mid_ema < long_ema) &
+            (short_diff < 0) &
+            (mid_diff < 0) &
+            (long_diff < 0)
         )
         
         # 生成交易信号
+        obv = df_15min['obv'].to_numpy(np.float64)
+        obv_ma = df_15min['obv_ma'].to_numpy(np.float64)
+        df_15min['ema_up_trend'] = ema_up_trend
+        df_15min['ema_down_trend'] = ema_down_trend
         df_15min['long_signal'] = (
-            df_15min['h1_bull_market'] & 
-            df_15min['ema_up_trend'] & 
-            (df_15min['obv'] > df_15min['obv_ma'])
+            df_15min['h1_bull_market'].to_numpy(np.bool_) & 
+            ema_up_trend & 
+            (obv > obv_ma)
         )
         
         df_15min['short_signal'] = (
-            df_15min['h1_bear_market'] & 
-            df_15min['ema_down_trend'] & 
-            (df_15min['obv'] < df_15min['obv_ma'])
+            df_15min['h1_bear_market'].to_numpy(np.bool_) & 
+            ema_down_trend & 
+            (obv < obv_ma)
         )
         
         return df_15min
@@ -78,130 +272,135 @@ class DualEMAStrategy:
         df_60min = self.calculate_indicators(df_60min)
         df_15min = self.generate_signals(df_15min, df_60min)
         
-        positions = []
-        trades = []
+        # 热点循环按numpy数组执行，避免逐行iloc
+        (positions, entry_idx, exit_idx, sides, entry_prices, exit_prices, pnl, exit_type,
+         self.position, self.entry_price, self.atr_value, open_entry_idx) = strategy_loop(
+            df_15min['high'].to_numpy(np.float64),
+            df_15min['low'].to_numpy(np.float64),
+            df_15min['close'].to_numpy(np.float64),
+            df_15min['long_signal'].to_numpy(np.bool_),
+            df_15min['short_signal'].to_numpy(np.bool_),
+            df_15min['atr'].to_numpy(np.float64),
+            3.0, 2.5, self.position, float(self.entry_price), float(self.atr_value)
+        )
         
-        for i in range(len(df_15min)):
-            current_bar = df_15min.iloc[i]
-            
-            # ATR止盈止损设置
-            if self.position != 0:
-                atr = self.atr_value
-                if self.position > 0:
-                    profit_level = self.entry_price + (atr * 3.0)
-                    stop_loss = self.entry_price - (atr * 2.5)
-                    
-                    if current_bar['high'] >= profit_level or current_bar['low'] <= stop_loss:
-                        trades.append({
-                            'entry_time': self.entry_time,
-                            'exit_time': current_bar.name,
-                            'type': 'LONG',
-                            'entry_price': self.entry_price,
-                            'exit_price': current_bar['close'],
-                            'pnl': current_bar['close'] - self.entry_price,
-                            'exit_type': '止盈' if current_bar['high'] >= profit_level else '止损'
-                        })
-                        self.position = 0
-                
-                else:  # short position
-                    profit_level = self.entry_price - (atr * 3.0)
-                    stop_loss = self.entry_price + (atr * 2.5)
-                    
-                    if current_bar['low'] <= profit_level or current_bar['high'] >= stop_loss:
-                        trades.append({
-                            'entry_time': self.entry_time,
-                            'exit_time': current_bar.name,
-                            'type': 'SHORT',
-                            'entry_price': self.entry_price,
-                            'exit_price': current_bar['close'],
-                            'pnl': self.entry_price - current_bar['close'],
-                            'exit_type': '止盈' if current_bar['low'] <= profit_level else '止损'
-                        })
-                        self.position = 0
-            
-            # 开仓信号
-            if self.position == 0:
-                if current_bar['long_signal']:
-                    self.position = 1
-                    self.entry_price = current_bar['close']
-                    self.entry_time = current_bar.name
-                    self.atr_value = current_bar['atr']
-                
-                elif current_bar['short_signal']:
-                    self.position = -1
-                    self.entry_price = current_bar['close']
-                    self.entry_time = current_bar.name
-                    self.atr_value = current_bar['atr']
-            
-            positions.append(self.position)
+        # 开仓位置为-1的交易沿用上一次运行遗留的开仓时间
+        index = df_15min.index
+        entry_time = [index[j] if j >= 0 else self.entry_time for j in entry_idx]
+        if self.position != 0 and open_entry_idx >= 0:
+            self.entry_time = index[open_entry_idx]
+        
+        trades = pd.DataFrame({
+            'entry_time': entry_time,
+            'exit_time': index.take(exit_idx),
+            'type': np.where(sides > 0, 'LONG', 'SHORT'),
+            'entry_price': entry_prices,
+            'exit_price': exit_prices,
+            'pnl': pnl,
+            'exit_type': EXIT_TYPE_NAMES[exit_type]
+        })
         
         df_15min['position'] = positions
-        return df_15min, pd.DataFrame(trades)
+        # 信号已按float64计算完毕，返回前将指标列收窄为float32，内存占用减半
+        df_15min = df_15min.astype(dict.fromkeys(FLOAT32_INDICATORS, np.float32))
+        return df_15min, trades
 
 def load_and_process_data(file_path):
-    df = pd.read_csv(file_path)
+    # 兼容DataFetcher生成的parquet缓存和历史csv文件
+    if Path(file_path).suffix == '.parquet':
+        # 保留float32存储，指标和回测计算时按需转换为float64数组
+        df = pd.read_parquet(file_path)
+    else:
+        # pyarrow引擎多线程解析csv，并直接把date列解析为时间戳
+        df = pd.read_csv(file_path, engine='pyarrow')
     df['date'] = pd.to_datetime(df['date'])
     df.set_index('date', inplace=True)
     return df
 
-def main():
-    # 加载数据
-    data_dir = Path('minute_data')
-    df_15min = load_and_process_data(data_dir / 'RB2505.SHF_future_15min_20240101_20251231.csv')
-    df_60min = load_and_process_data(data_dir / 'RB2505.SHF_future_60min_20240101_20251231.csv')
+# 默认回测的品种
+SYMBOLS = ['RB2505.SHF']
+
+def _trade_stats(trades):
+    # 计算交易统计，没有交易时返回None
+    if len(trades) == 0:
+        return None
+    
+    pnl = trades['pnl'].to_numpy()
+    
+    # 计算连续盈亏：对盈亏序列做游程编码，取盈利和亏损游程的最大长度
+    is_profit = pnl > 0
+    trades['is_profit'] = is_profit
+    boundaries = np.concatenate(([0], np.flatnonzero(np.diff(is_profit.view(np.int8))) + 1, [len(is_profit)]))
+    run_lengths = np.diff(boundaries)
+    run_is_profit = is_profit[boundaries[:-1]]
+    
+    # 计算月度收益，按year*100+month的整数分组
+    exit_time = trades['exit_time'].dt
+    trades['month'] = exit_time.year * 100 + exit_time.month
+    
+    return {
+        'mean_pnl': pnl.mean(),
+        'win_rate': is_profit.mean(),
+        'max_pnl': pnl.max(),
+        'min_pnl': pnl.min(),
+        'max_consecutive_wins': run_lengths[run_is_profit].max(initial=0),
+        'max_consecutive_losses': run_lengths[~run_is_profit].max(initial=0),
+        'monthly_pnl': trades.groupby('month')['pnl'].sum()
+    }
+
+def _find_data_file(data_dir, symbol, freq):
+    # 优先使用DataFetcher保存的parquet，没有时回退到历史csv文件
+    stem = f'{symbol}_future_{freq}_20240101_20251231'
+    parquet_path = data_dir / f'{stem}.parquet'
+    return parquet_path if parquet_path.exists() else data_dir / f'{stem}.csv'
+
+def _run_one_symbol(symbol, data_dir='minute_data'):
+    # 在子进程中加载单个品种的数据并回测，返回(交易明细, 统计结果)
+    data_dir = Path(data_dir)
+    df_15min = load_and_process_data(_find_data_file(data_dir, symbol, '15min'))
+    df_60min = load_and_process_data(_find_data_file(data_dir, symbol, '60min'))
     
     # 运行策略
     strategy = DualEMAStrategy()
     results_15min, trades_15min = strategy.run_strategy(df_15min, df_60min)
-    
+    return trades_15min, _trade_stats(trades_15min)
+
+def _print_report(symbol, trades_15min, stats):
     # 输出交易统计
-    print("\n15分钟周期交易统计:")
+    print(f"\n{symbol} 15分钟周期交易统计:")
     print(f"总交易次数: {len(trades_15min)}")
-    if len(trades_15min) > 0:
-        print(f"平均收益: {trades_15min['pnl'].mean():.2f}")
-        print(f"胜率: {(trades_15min['pnl'] > 0).mean():.2%}")
-        print(f"最大收益: {trades_15min['pnl'].max():.2f}")
-        print(f"最大亏损: {trades_15min['pnl'].min():.2f}")
-        
-        # 打印交易明细
-        print("\n交易明细:")
-        print("序号  开仓时间              平仓时间              方向    开仓价    平仓价    盈亏     平仓类型")
-        print("-" * 95)
-        for idx, trade in trades_15min.iterrows():
-            print(f"{idx+1:3d}  {trade['entry_time']:%Y-%m-%d %H:%M}  {trade['exit_time']:%Y-%m-%d %H:%M}  {'做多' if trade['type']=='LONG' else '做空'}  {trade['entry_price']:8.2f}  {trade['exit_price']:8.2f}  {trade['pnl']:8.2f}  {trade['exit_type']}")
-        
-        # 计算连续盈亏
-        trades_15min['is_profit'] = trades_15min['pnl'] > 0
-        consecutive_wins = 0
-        consecutive_losses = 0
-        max_consecutive_wins = 0
-        max_consecutive_losses = 0
-        current_streak = 0
-        
-        for is_profit in trades_15min['is_profit']:
-            if is_profit:
-                if current_streak > 0:
-                    current_streak += 1
-                else:
-                    current_streak = 1
-                max_consecutive_wins = max(max_consecutive_wins, current_streak)
-            else:
-                if current_streak < 0:
-                    current_streak -= 1
-                else:
-                    current_streak = -1
-                max_consecutive_losses = min(max_consecutive_losses, current_streak)
-        
-        print(f"\n最大连续盈利次数: {max_consecutive_wins}")
-        print(f"最大连续亏损次数: {abs(max_consecutive_losses)}")
-        
-        # 计算月度收益
-        trades_15min['month'] = trades_15min['exit_time'].dt.to_period('M')
-        monthly_pnl = trades_15min.groupby('month')['pnl'].sum()
-        
-        print("\n月度收益:")
-        for month, pnl in monthly_pnl.items():
-            print(f"{month}: {pnl:8.2f}")
+    if stats is None:
+        return
+    
+    print(f"平均收益: {stats['mean_pnl']:.2f}")
+    print(f"胜率: {stats['win_rate']:.2%}")
+    print(f"最大收益: {stats['max_pnl']:.2f}")
+    print(f"最大亏损: {stats['min_pnl']:.2f}")
+    
+    # 打印交易明细
+    print("\n交易明细:")
+    print("序号  开仓时间              平仓时间              方向    开仓价    平仓价    盈亏     平仓类型")
+    print("-" * 95)
+    for idx, trade in trades_15min.iterrows():
+        print(f"{idx+1:3d}  {trade['entry_time']:%Y-%m-%d %H:%M}  {trade['exit_time']:%Y-%m-%d %H:%M}  {'做多' if trade['type']=='LONG' else '做空'}  {trade['entry_price']:8.2f}  {trade['exit_price']:8.2f}  {trade['pnl']:8.2f}  {trade['exit_type']}")
+    
+    print(f"\n最大连续盈利次数: {stats['max_consecutive_wins']}")
+    print(f"最大连续亏损次数: {stats['max_consecutive_losses']}")
+    
+    print("\n月度收益:")
+    for month, pnl in stats['monthly_pnl'].items():
+        print(f"{month // 100}-{month % 100:02d}: {pnl:8.2f}")
+
+def main(symbols=None):
+    # 各品种的回测互不依赖且是CPU密集型，在多个进程中并行执行
+    symbols = symbols or SYMBOLS
+    max_workers = min(len(symbols), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_run_one_symbol, symbols))
+    
+    # 按品种顺序统一输出，避免多个进程的输出交错
+    for symbol, (trades_15min, stats) in zip(symbols, results):
+        _print_report(symbol, trades_15min, stats)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
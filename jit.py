@@ -0,0 +1,27 @@
+"""numba可选依赖
+
+安装了numba时导出numba.njit；未安装时njit退化为原样返回函数的装饰器，
+被装饰的函数按纯Python执行，结果不变，只是速度较慢。
+"""
+from loguru import logger
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("未安装numba，热点循环将以纯Python执行")
+
+    def njit(*args, **kwargs):
+        """numba.njit的替代实现，支持@njit、@njit(...)和@njit(signature, ...)三种写法"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+# 显式签名中使用的一维数组类型。pandas写时复制模式下to_numpy()可能返回只读数组，
+# 签名按只读、任意内存布局声明，可写数组和切片视图也能直接传入
+READONLY_F64 = 'Array(float64, 1, "A", readonly=True)'
+READONLY_BOOL = 'Array(boolean, 1, "A", readonly=True)'
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import shelve
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from loguru import logger
+
+# 持久化缓存目录
+LLM_CACHE_DIR = ".llm_cache"
+# 内存缓存最多保留的条目数
+LLM_MEMORY_CACHE_SIZE = 1024
+
+
+class LLMCache:
+    """LLM回复的两级缓存：进程内LRU + shelve磁盘持久化
+
+    以规范化后的请求内容（消息列表和生成参数）的摘要为键，同一批数据重复回测时
+    提示词完全相同，直接返回上次的回复，不再请求接口。
+    """
+
+    def __init__(self, cache_dir: str = LLM_CACHE_DIR, max_memory_items: int = LLM_MEMORY_CACHE_SIZE):
+        """初始化
+
+        Args:
+            cache_dir: 持久化缓存目录
+            max_memory_items: 内存缓存最多保留的条目数
+        """
+        self.path = os.path.join(cache_dir, "suggestions")
+        self.max_memory_items = max_memory_items
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        # shelve不支持并发读写，Streamlit多会话共享进程时需要加锁
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(messages: List[Dict[str, str]], **params) -> str:
+        """计算缓存键
+
+        Args:
+            messages: 消息列表
+            **params: 影响回复内容的参数，如model、temperature、max_tokens和接口地址base_url
+
+        Returns:
+            32位十六进制摘要
+        """
+        canonical = json.dumps({"messages": messages, "params": params}, ensure_ascii=False, sort_keys=True)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """读取缓存，依次查找内存和磁盘
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存的回复，未命中返回None
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            try:
+                with shelve.open(self.path, flag="r") as db:
+                    value = db.get(key)
+            except Exception:
+                # 缓存文件尚未创建或损坏时视为未命中
+                value = None
+            if value is not None:
+                self._remember(key, value)
+            return value
+
+    def set(self, key: str, value: str):
+        """写入内存和磁盘缓存
+
+        Args:
+            key: 缓存键
+            value: 回复内容
+        """
+        with self._lock:
+            self._remember(key, value)
+            try:
+                with shelve.open(self.path) as db:
+                    db[key] = value
+            except Exception as e:
+                logger.warning(f"写入LLM缓存失败: {str(e)}")
+
+    def _remember(self, key: str, value: str):
+        """写入内存缓存，超出容量时淘汰最久未使用的条目"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
@@ -3,12 +3,8 @@ import os
 from loguru import logger
 from datetime import datetime
 
-# 创建logs目录
-if not os.path.exists("logs"):
-    os.makedirs("logs")
-
-# 生成日志文件名
-log_file = f"logs/app_{datetime.now().strftime('%Y%m%d')}.log"
+# 文件日志处理器ID，未配置时为None
+_file_handler_id = None
 
 # 配置日志
 logger.remove()  # 移除默认的处理器
@@ -17,11 +13,36 @@ logger.add(
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
     level="INFO"
 )
-logger.add(
-    log_file,
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="DEBUG",
-    rotation="00:00",  # 每天轮换
-    retention="30 days",  # 保留30天
-    encoding="utf-8"
-) 
\ No newline at end of file
+
+def configure_file_logging(log_dir: str = "logs") -> int:
+    """添加按天轮换的文件日志处理器（只添加一次）
+    
+    文件处理器需要创建目录、打开文件并扫描过期日志，放在导入时会拖慢启动，
+    因此由程序入口显式调用。enqueue=True让写文件在后台线程完成，热点路径上的日志调用只需入队。
+    
+    Args:
+        log_dir: 日志目录
+        
+    Returns:
+        文件日志处理器ID
+    """
+    global _file_handler_id
+    if _file_handler_id is not None:
+        return _file_handler_id
+    
+    # 创建logs目录
+    os.makedirs(log_dir, exist_ok=True)
+    
+    # 生成日志文件名
+    log_file = os.path.join(log_dir, f"app_{datetime.now().strftime('%Y%m%d')}.log")
+    
+    _file_handler_id = logger.add(
+        log_file,
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        level="DEBUG",
+        rotation="00:00",  # 每天轮换
+        retention="30 days",  # 保留30天
+        encoding="utf-8",
+        enqueue=True
+    )
+    return _file_handler_id
@@ -1,19 +1,300 @@
+import functools
 import talib
+import bottleneck as bn
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Tuple, List, Optional
 from loguru import logger
+from jit import njit, NUMBA_AVAILABLE, READONLY_F64
+
+# 行情数值列
+OHLCV_COLUMNS = ['close', 'high', 'low', 'open', 'vol']
+
+# 支撑位和压力位列
+KEY_LEVEL_COLUMNS = ['support_1', 'support_2', 'resistance_1', 'resistance_2']
+
+# calculate_all并行计算各组指标的线程数
+INDICATOR_WORKERS = 4
+
+# 计算完成后以float32存储的指标列（递推仍以float64进行）。
+# EMA和MACD用于判断交叉，相邻K线的差值可能小于float32的精度，收窄后会产生虚假交叉；
+# OBV是累计成交量，量级可达1e10，支撑位和压力位要与float64收盘价比较，这些列保留float64
+INDICATOR_COLUMNS = [
+    'MACD_hist', 'RSI', 'bb_middle', 'bb_upper', 'bb_lower', 'k', 'd', 'j', 'atr'
+]
+
+# get_indicators_at_point返回的指标名与列名的对应关系
+POINT_FIELDS = {
+    'close': 'close',
+    'change': 'pct_chg',
+    'vol': 'vol',
+    'EMA_short': 'EMA_short',
+    'EMA_long': 'EMA_long',
+    'MACD': 'MACD',
+    'MACD_signal': 'MACD_signal',
+    'MACD_hist': 'MACD_hist',
+    'RSI': 'RSI',
+    'bb_upper': 'bb_upper',
+    'bb_middle': 'bb_middle',
+    'bb_lower': 'bb_lower',
+    'k': 'k',
+    'd': 'd',
+    'j': 'j',
+    'obv': 'obv',
+    'atr': 'atr'
+}
+
+@functools.lru_cache(maxsize=32)
+def _span_alpha(span: int) -> float:
+    """按pandas的方式由span计算EWM平滑系数，保证与ewm(span=...)结果逐位一致
+    
+    常用周期只有少数几个，结果按span缓存，以标量传给编译的递推函数。
+    
+    Args:
+        span: 周期
+        
+    Returns:
+        平滑系数alpha
+    """
+    com = (span - 1) / 2.0
+    return 1.0 / (1.0 + com)
+
+@njit('UniTuple(float64, 2)(float64, float64, float64, float64)', cache=True)
+def _ewm_step(weighted, old_wt, cur, alpha):
+    """EWM(adjust=False)的单步递推，与pandas的实现逐位一致
+    
+    Args:
+        weighted: 上一步的均值
+        old_wt: 上一步旧值的权重
+        cur: 当前值
+        alpha: 平滑系数
+        
+    Returns:
+        (当前均值, 旧值权重)
+    """
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if cur == cur:
+            if weighted != cur:
+                weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            old_wt = 1.0
+    elif cur == cur:
+        weighted = cur
+    return weighted, old_wt
+
+@njit(f'float64[::1]({READONLY_F64}, float64)', cache=True)
+def _ewm_adjust_false(x, alpha):
+    """与Series.ewm(alpha=alpha, adjust=False).mean()等价的递推
+    
+    NaN的处理与pandas一致：首个有效值之前输出NaN，之后遇到NaN时沿用上一个值，
+    并在下一个有效值到来时按间隔衰减旧值的权重。
+    
+    Args:
+        x: float64数组
+        alpha: 平滑系数
+        
+    Returns:
+        EWM均值数组
+    """
+    n = len(x)
+    out = np.empty(n)
+    if n == 0:
+        return out
+    weighted = x[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        weighted, old_wt = _ewm_step(weighted, old_wt, x[i], alpha)
+        out[i] = weighted
+    return out
+
+def _ewm(x: np.ndarray, span: int) -> np.ndarray:
+    """EWM(adjust=False)均值
+    
+    安装了numba时使用编译的递推，否则使用pandas的C实现，两者结果逐位一致。
+    
+    Args:
+        x: float64数组
+        span: 周期
+        
+    Returns:
+        EWM均值数组
+    """
+    if NUMBA_AVAILABLE:
+        return _ewm_adjust_false(x, _span_alpha(span))
+    return pd.Series(x).ewm(span=span, adjust=False).mean().to_numpy()
+
+@njit(f'UniTuple(float64[::1], 6)({READONLY_F64}, {READONLY_F64}, float64, float64, float64, float64, float64)',
+      cache=True, nogil=True)
+def _fused_price_indicators(close, vol, alpha_short, alpha_long, alpha_fast, alpha_slow, alpha_signal):
+    """一次遍历收盘价和成交量，同时计算短期/长期EMA、MACD和OBV
+    
+    各EMA与_ewm_adjust_false逐位一致；OBV与talib.OBV一致，从收盘价和成交量都有效的
+    第一个位置开始累计。
+    
+    Args:
+        close: 收盘价float64数组
+        vol: 成交量float64数组
+        alpha_short: 短期EMA平滑系数
+        alpha_long: 长期EMA平滑系数
+        alpha_fast: MACD快线平滑系数
+        alpha_slow: MACD慢线平滑系数
+        alpha_signal: MACD信号线平滑系数
+        
+    Returns:
+        (短期EMA, 长期EMA, MACD线, 信号线, 柱状图, OBV)
+    """
+    n = len(close)
+    ema_short = np.empty(n)
+    ema_long = np.empty(n)
+    macd = np.empty(n)
+    macd_signal = np.empty(n)
+    macd_hist = np.empty(n)
+    obv = np.full(n, np.nan)
+    if n == 0:
+        return ema_short, ema_long, macd, macd_signal, macd_hist, obv
+    
+    # 各EMA的状态（均值, 旧值权重）
+    short_w, short_old = close[0], 1.0
+    long_w, long_old = close[0], 1.0
+    fast_w, fast_old = close[0], 1.0
+    slow_w, slow_old = close[0], 1.0
+    signal_w, signal_old = fast_w - slow_w, 1.0
+    # OBV状态
+    started = False
+    obv_value = 0.0
+    prev_close = 0.0
+    
+    for i in range(n):
+        cur = close[i]
+        if i > 0:
+            short_w, short_old = _ewm_step(short_w, short_old, cur, alpha_short)
+            long_w, long_old = _ewm_step(long_w, long_old, cur, alpha_long)
+            fast_w, fast_old = _ewm_step(fast_w, fast_old, cur, alpha_fast)
+            slow_w, slow_old = _ewm_step(slow_w, slow_old, cur, alpha_slow)
+            signal_w, signal_old = _ewm_step(signal_w, signal_old, fast_w - slow_w, alpha_signal)
+        ema_short[i] = short_w
+        ema_long[i] = long_w
+        macd[i] = fast_w - slow_w
+        macd_signal[i] = signal_w
+        macd_hist[i] = macd[i] - signal_w
+        
+        if started:
+            if cur > prev_close:
+                obv_value += vol[i]
+            elif cur < prev_close:
+                obv_value -= vol[i]
+            prev_close = cur
+            obv[i] = obv_value
+        elif cur == cur and vol[i] == vol[i]:
+            started = True
+            obv_value = vol[i]
+            prev_close = cur
+            obv[i] = obv_value
+    
+    return ema_short, ema_long, macd, macd_signal, macd_hist, obv
+
+@njit(f'float64[::1]({READONLY_F64}, int64)', cache=True, nogil=True)
+def _rsi_wilder(close, period):
+    """Wilder平滑的RSI，计算过程与talib.RSI一致
+    
+    从第一个有效收盘价开始，用前period个差值的均值作为初始平均涨跌幅，
+    之后按avg = (avg * (period - 1) + 当期涨跌) / period递推。
+    
+    Args:
+        close: 收盘价float64数组
+        period: RSI周期
+        
+    Returns:
+        RSI数组，前period个有效值之前为NaN
+    """
+    n = len(close)
+    rsi = np.full(n, np.nan)
+    start = 0
+    while start < n and close[start] != close[start]:
+        start += 1
+    if n - start <= period:
+        return rsi
+    
+    # 用前period个差值的均值作为初始值
+    prev_value = close[start]
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(start + 1, start + period + 1):
+        delta = close[i] - prev_value
+        prev_value = close[i]
+        if delta < 0:
+            avg_loss -= delta
+        else:
+            avg_gain += delta
+    avg_loss /= period
+    avg_gain /= period
+    total = avg_gain + avg_loss
+    rsi[start + period] = 100.0 * (avg_gain / total) if abs(total) >= 1e-14 else 0.0
+    
+    # Wilder平滑
+    for i in range(start + period + 1, n):
+        delta = close[i] - prev_value
+        prev_value = close[i]
+        avg_loss *= period - 1
+        avg_gain *= period - 1
+        if delta < 0:
+            avg_loss -= delta
+        else:
+            avg_gain += delta
+        avg_loss /= period
+        avg_gain /= period
+        total = avg_gain + avg_loss
+        rsi[i] = 100.0 * (avg_gain / total) if abs(total) >= 1e-14 else 0.0
+    return rsi
+
+def _pivot_levels(high_max, low_min, close, atr):
+    """由回看区间的最高价、最低价、收盘价和ATR计算支撑位和压力位
+    
+    参数可以是标量，也可以是逐K线的数组（此时逐元素计算）。
+    
+    Args:
+        high_max: 回看区间最高价
+        low_min: 回看区间最低价
+        close: 收盘价
+        atr: ATR
+        
+    Returns:
+        (强支撑位, 支撑位, 强压力位, 压力位)
+    """
+    # 计算PP（中枢点）、R1和S1
+    pp = (high_max + low_min + close) / 3
+    r1 = 2 * pp - low_min
+    s1 = 2 * pp - high_max
+    return s1 - 0.5 * atr, pp - atr, r1 + 0.5 * atr, pp + atr
 
 class TechnicalIndicators:
     """技术指标计算类"""
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, inplace: bool = False):
         """初始化技术指标计算器
         
+        默认只做浅拷贝：指标列的新增和OHLCV列的类型转换都是整列替换，不会改写原DataFrame的数据，
+        无需深拷贝整个DataFrame。
+        
         Args:
             df: 包含OHLCV数据的DataFrame
+            inplace: 为True时直接在df上新增指标列并转换OHLCV列类型，调用方的DataFrame会被修改
         """
-        self.df = df.copy()
+        self.df = df if inplace else df.copy(deep=False)
+        # get_indicators_at_point使用的列数组，在calculate_all完成后构建
+        self._cols: Optional[Dict[str, np.ndarray]] = None
+        
+        # OHLCV列一次性转换为float64（talib只接受float64输入，缓存数据可能是float32），
+        # 多次调用calculate_all时无需重复转换
+        try:
+            values = self.df[OHLCV_COLUMNS]
+            if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in values.dtypes):
+                values = values.apply(pd.to_numeric, errors='coerce')
+            self.df[OHLCV_COLUMNS] = values.astype(np.float64, copy=False)
+        except Exception as e:
+            logger.error(f"数据格式转换失败: {str(e)}")
         
     def calculate_ema(self, period: int, column: str = 'close') -> pd.Series:
         """计算EMA
@@ -25,7 +306,7 @@ class TechnicalIndicators:
         Returns:
             EMA序列
         """
-        return self.df[column].ewm(span=period, adjust=False).mean()
+        return pd.Series(_ewm(self.df[column].to_numpy(np.float64), period), index=self.df.index)
         
     def calculate_all(self, ema_short_period: int = 5, ema_long_period: int = 13) -> pd.DataFrame:
         """计算所有技术指标
@@ -39,41 +320,45 @@ class TechnicalIndicators:
         """
         logger.info("开始计算技术指标")
         
-        # 确保数据格式正确
+        # 检查是否有无效数据（OHLCV列已在初始化时转换为float64）
         try:
-            self.df['close'] = pd.to_numeric(self.df['close'], errors='coerce')
-            self.df['high'] = pd.to_numeric(self.df['high'], errors='coerce')
-            self.df['low'] = pd.to_numeric(self.df['low'], errors='coerce')
-            self.df['open'] = pd.to_numeric(self.df['open'], errors='coerce')
-            self.df['vol'] = pd.to_numeric(self.df['vol'], errors='coerce')
-            
-            # 检查是否有无效数据
-            if self.df[['close', 'high', 'low', 'open', 'vol']].isnull().any().any():
+            if self.df[OHLCV_COLUMNS].isnull().any().any():
                 logger.warning("数据中存在无效值，将使用前值填充")
-                self.df = self.df.fillna(method='ffill')
+                self.df = self.df.ffill()
         except Exception as e:
-            logger.error(f"数据格式转换失败: {str(e)}")
+            logger.error(f"数据检查失败: {str(e)}")
             return self.df
         
-        # 计算EMA
-        logger.debug(f"计算EMA指标: 短期={ema_short_period}, 长期={ema_long_period}")
-        self.df['EMA_short'] = self.calculate_ema(ema_short_period)
-        self.df['EMA_long'] = self.calculate_ema(ema_long_period)
+        # 计算EMA、MACD、OBV、RSI、布林带、KDJ和ATR
+        # 各组指标只读取OHLCV、结果互不依赖，且计算时释放GIL（talib/bottleneck/nogil的numba函数），
+        # 在线程池中并行计算，全部完成后再按原顺序写回DataFrame
+        logger.debug(f"计算EMA、MACD和OBV指标: 短期={ema_short_period}, 长期={ema_long_period}")
+        high = self.df['high'].to_numpy(np.float64)
+        low = self.df['low'].to_numpy(np.float64)
+        close = self.df['close'].to_numpy(np.float64)
+        vol = self.df['vol'].to_numpy(np.float64)
+        with ThreadPoolExecutor(max_workers=INDICATOR_WORKERS) as executor:
+            price_future = executor.submit(self._calculate_price_indicators, close, vol, ema_short_period, ema_long_period)
+            rsi_future = executor.submit(self.calculate_rsi)
+            bb_future = executor.submit(self.calculate_bollinger_bands, self.df['close'])
+            kdj_future = executor.submit(self.calculate_kdj, self.df['high'], self.df['low'], self.df['close'])
+            atr_future = executor.submit(talib.ATR, high, low, close)
         
-        # 计算MACD
-        logger.debug("计算MACD指标")
         try:
-            self.df['MACD'], self.df['MACD_signal'], self.df['MACD_hist'] = self.calculate_macd()
+            ema_short, ema_long, macd, macd_signal, macd_hist, obv = price_future.result()
         except Exception as e:
-            logger.error(f"MACD计算失败: {str(e)}")
-            self.df['MACD'] = np.nan
-            self.df['MACD_signal'] = np.nan
-            self.df['MACD_hist'] = np.nan
+            logger.error(f"EMA、MACD和OBV计算失败: {str(e)}")
+            ema_short = ema_long = macd = macd_signal = macd_hist = obv = np.nan
+        self.df['EMA_short'] = ema_short
+        self.df['EMA_long'] = ema_long
+        self.df['MACD'] = macd
+        self.df['MACD_signal'] = macd_signal
+        self.df['MACD_hist'] = macd_hist
         
         # 计算RSI
         logger.debug("计算RSI指标")
         try:
-            self.df['RSI'] = self.calculate_rsi()
+            self.df['RSI'] = rsi_future.result()
         except Exception as e:
             logger.error(f"RSI计算失败: {str(e)}")
             self.df['RSI'] = np.nan
@@ -81,7 +366,7 @@ class TechnicalIndicators:
         # 计算布林带
         logger.debug("计算布林带指标")
         try:
-            self.df['bb_middle'], self.df['bb_upper'], self.df['bb_lower'] = self.calculate_bollinger_bands(self.df['close'])
+            self.df['bb_middle'], self.df['bb_upper'], self.df['bb_lower'] = bb_future.result()
         except Exception as e:
             logger.error(f"布林带计算失败: {str(e)}")
             self.df['bb_middle'] = np.nan
@@ -91,52 +376,88 @@ class TechnicalIndicators:
         # 计算KDJ
         logger.debug("计算KDJ指标")
         try:
-            self.df['k'], self.df['d'], self.df['j'] = self.calculate_kdj(self.df['high'], self.df['low'], self.df['close'])
+            self.df['k'], self.df['d'], self.df['j'] = kdj_future.result()
         except Exception as e:
             logger.error(f"KDJ计算失败: {str(e)}")
             self.df['k'] = np.nan
             self.df['d'] = np.nan
             self.df['j'] = np.nan
         
-        # 计算成交量指标
-        logger.debug("计算OBV指标")
-        try:
-            self.df['obv'] = talib.OBV(self.df['close'], self.df['vol'])
-        except Exception as e:
-            logger.error(f"OBV计算失败: {str(e)}")
-            self.df['obv'] = np.nan
+        # 成交量指标OBV已在上面与EMA一起计算
+        self.df['obv'] = obv
         
         # 计算ATR
         logger.debug("计算ATR指标")
         try:
-            self.df['atr'] = talib.ATR(self.df['high'], self.df['low'], self.df['close'])
+            self.df['atr'] = atr_future.result()
         except Exception as e:
             logger.error(f"ATR计算失败: {str(e)}")
             self.df['atr'] = np.nan
         
         # 计算压力位和支撑位
         logger.debug("计算压力位和支撑位")
-        self.df['support_levels'] = None
-        self.df['resistance_levels'] = None
-        
-        # 为每个数据点计算压力位和支撑位
-        for i in range(len(self.df)):
-            # 确保有足够的数据计算，但至少需要5个数据点
-            lookback = min(34, max(5, i + 1))
-            if i >= lookback - 1:  # 确保有足够的数据计算
-                support_levels, resistance_levels = self.find_key_levels(
-                    self.df.iloc[i-lookback+1:i+1],
-                    lookback=lookback
-                )
-                # 将numpy数组转换为列表
-                self.df.at[i, 'support_levels'] = support_levels.tolist() if isinstance(support_levels, np.ndarray) else support_levels
-                self.df.at[i, 'resistance_levels'] = resistance_levels.tolist() if isinstance(resistance_levels, np.ndarray) else resistance_levels
+        # 回看最近34根K线，不足34根时使用全部历史，至少需要5根，
+        # 用bottleneck的O(N)滑动最值一次性算出每根K线的回看区间极值
+        n = len(self.df)
+        if n >= 5:
+            window = min(34, n)
+            high_max = bn.move_max(self.df['high'].to_numpy(np.float64), window=window, min_count=5)
+            low_min = bn.move_min(self.df['low'].to_numpy(np.float64), window=window, min_count=5)
+        else:
+            high_max = low_min = np.full(n, np.nan)
+        
+        # 依次为强支撑位、支撑位、强压力位、压力位，数据不足的位置为NaN
+        self.df[KEY_LEVEL_COLUMNS] = np.column_stack(_pivot_levels(
+            high_max, low_min, self.df['close'].to_numpy(), self.df['atr'].to_numpy()
+        ))
+        
+        # 指标只用于信号判断和生成提示词，float32精度足够，内存占用减半
+        self.df[INDICATOR_COLUMNS] = self.df[INDICATOR_COLUMNS].astype(np.float32)
+        
+        # 按列取出numpy数组，按位置取指标时不再构造行Series
+        self._cols = self._point_columns()
         
         logger.info("技术指标计算完成")
         return self.df
     
+    def _calculate_price_indicators(self, close: np.ndarray, vol: np.ndarray,
+                                    ema_short_period: int, ema_long_period: int) -> Tuple[np.ndarray, ...]:
+        """计算EMA、MACD和OBV
+        
+        Args:
+            close: 收盘价float64数组
+            vol: 成交量float64数组
+            ema_short_period: 短期EMA周期
+            ema_long_period: 长期EMA周期
+            
+        Returns:
+            (短期EMA, 长期EMA, MACD线, 信号线, 柱状图, OBV)
+        """
+        if NUMBA_AVAILABLE:
+            # 一次遍历同时计算，只读取一遍收盘价和成交量
+            return _fused_price_indicators(
+                close,
+                vol,
+                _span_alpha(ema_short_period),
+                _span_alpha(ema_long_period),
+                _span_alpha(12),
+                _span_alpha(26),
+                _span_alpha(9)
+            )
+        
+        # 未安装numba时逐元素的Python递推很慢，改用pandas和talib的C实现，结果一致
+        macd, macd_signal, macd_hist = (series.to_numpy() for series in self.calculate_macd())
+        return (
+            _ewm(close, ema_short_period),
+            _ewm(close, ema_long_period),
+            macd,
+            macd_signal,
+            macd_hist,
+            talib.OBV(close, vol)
+        )
+        
     def calculate_rsi(self, period: int = 14) -> pd.Series:
-        """计算RSI
+        """计算RSI（Wilder平滑，与talib.RSI一致）
         
         Args:
             period: RSI周期
@@ -144,11 +465,10 @@ class TechnicalIndicators:
         Returns:
             RSI序列
         """
-        delta = self.df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        close = self.df['close'].to_numpy(np.float64)
+        # 未安装numba时Python逐元素递推很慢，改用talib的C实现（同为Wilder平滑，差异在1e-13以内）
+        rsi = _rsi_wilder(close, period) if NUMBA_AVAILABLE else talib.RSI(close, timeperiod=period)
+        return pd.Series(rsi, index=self.df.index)
         
     def calculate_macd(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """计算MACD
@@ -161,12 +481,14 @@ class TechnicalIndicators:
         Returns:
             MACD线、信号线和柱状图
         """
-        exp1 = self.df['close'].ewm(span=fast_period, adjust=False).mean()
-        exp2 = self.df['close'].ewm(span=slow_period, adjust=False).mean()
+        close = self.df['close'].to_numpy(np.float64)
+        exp1 = _ewm(close, fast_period)
+        exp2 = _ewm(close, slow_period)
         macd = exp1 - exp2
-        signal = macd.ewm(span=signal_period, adjust=False).mean()
+        signal = _ewm(macd, signal_period)
         hist = macd - signal
-        return macd, signal, hist
+        index = self.df.index
+        return pd.Series(macd, index=index), pd.Series(signal, index=index), pd.Series(hist, index=index)
         
     def calculate_kdj(self, high: pd.Series, low: pd.Series, close: pd.Series, 
                      n: int = 9, m1: int = 3, m2: int = 3) -> Tuple[pd.Series, pd.Series, pd.Series]:
@@ -183,10 +505,17 @@ class TechnicalIndicators:
         Returns:
             (K值, D值, J值)
         """
-        low_list = low.rolling(window=n, min_periods=n).min()
-        high_list = high.rolling(window=n, min_periods=n).max()
-        
-        rsv = (close - low_list) / (high_list - low_list) * 100
+        # bottleneck的滑动最值为O(N)的C实现，RSV直接在numpy数组上计算，无需对齐三个Series
+        if len(close) >= n:
+            low_list = bn.move_min(low.to_numpy(np.float64), window=n, min_count=n)
+            high_list = bn.move_max(high.to_numpy(np.float64), window=n, min_count=n)
+        else:
+            # bottleneck要求窗口不超过数据长度，数据不足时结果全为NaN
+            low_list = high_list = np.full(len(close), np.nan)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsv = (close.to_numpy(np.float64) - low_list) / (high_list - low_list) * 100
+        rsv = pd.Series(rsv, index=close.index)
         
         k = pd.DataFrame(rsv).ewm(com=m1-1, adjust=True, min_periods=n).mean()
         d = k.ewm(com=m2-1, adjust=True, min_periods=n).mean()
@@ -206,11 +535,14 @@ class TechnicalIndicators:
         Returns:
             (中轨, 上轨, 下轨)
         """
-        middle = data.rolling(window=period).mean()
-        std = data.rolling(window=period).std()
+        values = data.to_numpy(np.float64)
+        middle = talib.SMA(values, timeperiod=period)
+        # talib.STDDEV为总体标准差，乘以sqrt(n/(n-1))换算为与rolling().std()一致的样本标准差
+        std = talib.STDDEV(values, timeperiod=period, nbdev=1) * np.sqrt(period / (period - 1))
         upper = middle + (std * std_dev)
         lower = middle - (std * std_dev)
-        return middle, upper, lower
+        index = data.index
+        return pd.Series(middle, index=index), pd.Series(upper, index=index), pd.Series(lower, index=index)
     
     def get_indicators_at_point(self, index: int) -> Dict[str, Any]:
         """获取某个时间点的所有技术指标
@@ -222,44 +554,28 @@ class TechnicalIndicators:
             技术指标字典
         """
         logger.debug(f"获取第{index}个数据点的技术指标")
-        point = self.df.iloc[index]
+        if self._cols is None:
+            self._cols = self._point_columns()
+        cols = self._cols
         
-        # 获取支撑位和压力位
-        support_levels = point['support_levels']
-        resistance_levels = point['resistance_levels']
+        indicators = {name: cols[column][index] for name, column in POINT_FIELDS.items()}
         
-        # 处理None值
-        if support_levels is None:
-            support_levels = []
-        elif isinstance(support_levels, np.ndarray):
-            support_levels = support_levels.tolist()
-            
-        if resistance_levels is None:
-            resistance_levels = []
-        elif isinstance(resistance_levels, np.ndarray):
-            resistance_levels = resistance_levels.tolist()
-        
-        return {
-            'close': point['close'],
-            'change': point['pct_chg'],
-            'vol': point['vol'],
-            'EMA_short': point['EMA_short'],
-            'EMA_long': point['EMA_long'],
-            'MACD': point['MACD'],
-            'MACD_signal': point['MACD_signal'],
-            'MACD_hist': point['MACD_hist'],
-            'RSI': point['RSI'],
-            'bb_upper': point['bb_upper'],
-            'bb_middle': point['bb_middle'],
-            'bb_lower': point['bb_lower'],
-            'k': point['k'],
-            'd': point['d'],
-            'j': point['j'],
-            'obv': point['obv'],
-            'atr': point['atr'],
-            'support_levels': support_levels,
-            'resistance_levels': resistance_levels
-        }
+        # 获取支撑位和压力位，数据不足时为空列表
+        support_levels = [cols['support_1'][index], cols['support_2'][index]]
+        resistance_levels = [cols['resistance_1'][index], cols['resistance_2'][index]]
+        indicators['support_levels'] = [] if np.isnan(support_levels).any() else support_levels
+        indicators['resistance_levels'] = [] if np.isnan(resistance_levels).any() else resistance_levels
+        
+        return indicators
+    
+    def _point_columns(self) -> Dict[str, np.ndarray]:
+        """取出get_indicators_at_point所需各列的numpy数组
+        
+        Returns:
+            列名到数组的字典，缺少的列不包含在内
+        """
+        columns = list(POINT_FIELDS.values()) + KEY_LEVEL_COLUMNS
+        return {c: self.df[c].to_numpy() for c in columns if c in self.df.columns}
         
     def find_key_levels(self, df: pd.DataFrame, lookback: int = 34) -> Tuple[List[float], List[float]]:
         """计算压力位和支撑位
@@ -271,8 +587,6 @@ class TechnicalIndicators:
         Returns:
             (支撑位列表, 压力位列表)
         """
-        logger.debug(f"计算压力位和支撑位，回看周期: {lookback}")
-        
         # 确保数据足够
         if len(df) < 5:  # 至少需要5个数据点
             logger.warning(f"数据量不足5条，无法计算压力位和支撑位")
@@ -290,16 +604,9 @@ class TechnicalIndicators:
             logger.error(f"ATR计算失败: {str(e)}")
             atr = (high.max() - low.min()) / 10  # 使用简单的波动率估计
         
-        # 计算PP（中枢点）
-        pp = (high.max() + low.min() + close[-1]) / 3
-        
-        # 计算R1和S1
-        r1 = 2 * pp - low.min()
-        s1 = 2 * pp - high.max()
-        
         # 计算支撑位和压力位
-        support_levels = np.array([s1 - 0.5 * atr, pp - atr])
-        resistance_levels = np.array([r1 + 0.5 * atr, pp + atr])
+        strong_support, support, strong_resistance, resistance = _pivot_levels(high.max(), low.min(), close[-1], atr)
+        support_levels = np.array([strong_support, support])
+        resistance_levels = np.array([strong_resistance, resistance])
         
-        logger.debug(f"支撑位: {support_levels}, 压力位: {resistance_levels}")
         return support_levels, resistance_levels 
\ No newline at end of file